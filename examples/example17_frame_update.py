@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2017 Scott Shawcroft, written for Adafruit Industries
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+
+#  This is example is for the SparkFun Serial LCD displays.
+#  SparkFun sells these at its website: www.sparkfun.com
+#  Do you like this library? Help support SparkFun. Buy a board!
+#  https://www.sparkfun.com/products/14072
+#  https://www.sparkfun.com/products/14073
+#  https://www.sparkfun.com/products/14074
+
+"""
+ Serial LCD Example 17 - example17_frame_update.py
+
+
+ Example 17 - Frame Update:
+ This program writes a full screen of text to the display
+ every update, but only the characters that changed since
+ the last frame are sent to the display.
+"""
+from time import sleep, monotonic
+import board
+from sparkfun_serlcd import Sparkfun_SerLCD_I2C
+
+i2c = board.I2C()
+serlcd = Sparkfun_SerLCD_I2C(i2c)
+
+print("Example 17: Frame Update")
+print("Press Ctrl-C to end program.")
+
+start = monotonic()
+count = 0
+
+try:
+    while True:
+        elapsed = monotonic() - start
+        serlcd.write_frame(
+            ["Frame Update", "Count: {}".format(count), "Time: {:.1f}".format(elapsed)]
+        )
+        count += 1
+        sleep(0.1)
+
+except KeyboardInterrupt:
+    pass
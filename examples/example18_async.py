@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2017 Scott Shawcroft, written for Adafruit Industries
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+
+#  This is example is for the SparkFun Serial LCD displays.
+#  SparkFun sells these at its website: www.sparkfun.com
+#  Do you like this library? Help support SparkFun. Buy a board!
+#  https://www.sparkfun.com/products/14072
+#  https://www.sparkfun.com/products/14073
+#  https://www.sparkfun.com/products/14074
+
+"""
+ Serial LCD Example 18 - example18_async.py
+
+
+ Example 18 - Asyncio:
+ This program updates the display from one asyncio task
+ while another task keeps running, without the display
+ blocking the event loop.
+"""
+import asyncio
+import board
+from sparkfun_serlcd_async import Sparkfun_SerLCD_I2C_Async
+
+i2c = board.I2C()
+serlcd = Sparkfun_SerLCD_I2C_Async(i2c)
+
+print("Example 18: Asyncio")
+print("Press Ctrl-C to end program.")
+
+
+async def show_count():
+    count = 0
+    while True:
+        async with serlcd.batch():
+            await serlcd.set_cursor(0, 0)
+            await serlcd.write("Count: {}".format(count))
+        count += 1
+        await asyncio.sleep(0.1)
+
+
+async def blink_console():
+    while True:
+        print(".", end="")
+        await asyncio.sleep(0.5)
+
+
+async def main():
+    await asyncio.gather(show_count(), blink_console())
+
+
+try:
+    asyncio.run(main())
+
+except KeyboardInterrupt:
+    pass
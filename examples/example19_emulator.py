@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2017 Scott Shawcroft, written for Adafruit Industries
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+
+#  This is example is for the SparkFun Serial LCD displays.
+#  SparkFun sells these at its website: www.sparkfun.com
+#  Do you like this library? Help support SparkFun. Buy a board!
+#  https://www.sparkfun.com/products/14072
+#  https://www.sparkfun.com/products/14073
+#  https://www.sparkfun.com/products/14074
+
+"""
+ Serial LCD Example 19 - example19_emulator.py
+
+
+ Example 19 - Emulator:
+ This program runs the driver against an emulated display,
+ so it needs no hardware.  It writes a few frames and then
+ prints what the display shows and how much work it took.
+"""
+from time import monotonic
+from sparkfun_serlcd import Sparkfun_SerLCD_UART
+from sparkfun_serlcd_emulator import OpenLCD_Emulator
+
+emulator = OpenLCD_Emulator()
+serlcd = Sparkfun_SerLCD_UART(emulator)
+
+print("Example 19: Emulator")
+
+start = monotonic()
+for count in range(20):
+    serlcd.write_frame(["Emulator", "Count: {}".format(count)])
+serlcd.wait()
+elapsed = monotonic() - start
+
+for line in emulator.text:
+    print("|" + line + "|")
+
+print("Time: {:.3f} s".format(elapsed))
+print("Bytes received: {}".format(emulator.bytes_received))
+print("Commands: {}".format(emulator.commands))
+print("Display busy: {:.3f} s".format(emulator.busy_time))
+print("Wire time: {:.3f} s".format(emulator.wire_time))
+print("Overruns: {}".format(emulator.overruns))
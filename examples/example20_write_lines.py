@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2017 Scott Shawcroft, written for Adafruit Industries
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+
+#  This is example is for the SparkFun Serial LCD displays.
+#  SparkFun sells these at its website: www.sparkfun.com
+#  Do you like this library? Help support SparkFun. Buy a board!
+#  https://www.sparkfun.com/products/14072
+#  https://www.sparkfun.com/products/14073
+#  https://www.sparkfun.com/products/14074
+
+"""
+ Serial LCD Example 20 - example20_write_lines.py
+
+
+ Example 20 - Write Lines:
+ This program writes rows of text aligned left, center
+ and right, without clearing the display in between.
+"""
+from time import sleep
+import board
+from sparkfun_serlcd import (
+    Sparkfun_SerLCD_I2C,
+    ALIGN_LEFT,
+    ALIGN_CENTER,
+    ALIGN_RIGHT,
+)
+
+i2c = board.I2C()
+serlcd = Sparkfun_SerLCD_I2C(i2c)
+
+print("Example 20: Write Lines")
+print("Press Ctrl-C to end program.")
+
+try:
+    while True:
+        for align in (ALIGN_LEFT, ALIGN_CENTER, ALIGN_RIGHT):
+            serlcd.write_lines(["Write Lines", "Aligned text"], align)
+            sleep(1)
+        serlcd.write_row(1, "Row 1 only", ALIGN_CENTER)
+        sleep(1)
+
+except KeyboardInterrupt:
+    pass
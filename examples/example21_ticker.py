@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2017 Scott Shawcroft, written for Adafruit Industries
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+
+#  This is example is for the SparkFun Serial LCD displays.
+#  SparkFun sells these at its website: www.sparkfun.com
+#  Do you like this library? Help support SparkFun. Buy a board!
+#  https://www.sparkfun.com/products/14072
+#  https://www.sparkfun.com/products/14073
+#  https://www.sparkfun.com/products/14074
+
+"""
+ Serial LCD Example 21 - example21_ticker.py
+
+
+ Example 21 - Ticker:
+ This program scrolls a message that is too long for the
+ display across it, like a news ticker.
+"""
+import board
+from sparkfun_serlcd import Sparkfun_SerLCD_I2C
+from sparkfun_serlcd_ticker import Sparkfun_SerLCD_Ticker
+
+i2c = board.I2C()
+serlcd = Sparkfun_SerLCD_I2C(i2c)
+
+print("Example 21: Ticker")
+print("Press Ctrl-C to end program.")
+
+ticker = Sparkfun_SerLCD_Ticker(
+    serlcd,
+    ["This message is much too long to fit on the display at once.", "Ticker"],
+    speed=8,
+)
+
+try:
+    while True:
+        ticker.update()
+
+except KeyboardInterrupt:
+    ticker.stop()
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2017 Scott Shawcroft, written for Adafruit Industries
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+
+#  This is example is for the SparkFun Serial LCD displays.
+#  SparkFun sells these at its website: www.sparkfun.com
+#  Do you like this library? Help support SparkFun. Buy a board!
+#  https://www.sparkfun.com/products/14072
+#  https://www.sparkfun.com/products/14073
+#  https://www.sparkfun.com/products/14074
+
+"""
+ Serial LCD Example 22 - example22_backlight_animation.py
+
+
+ Example 22 - Backlight Animation:
+ This program fades the backlight between colors, and then
+ pulses it while the main loop keeps running.
+"""
+from time import monotonic
+import board
+from sparkfun_serlcd import Sparkfun_SerLCD_I2C
+from sparkfun_serlcd_backlight import Sparkfun_SerLCD_Backlight
+
+i2c = board.I2C()
+serlcd = Sparkfun_SerLCD_I2C(i2c)
+backlight = Sparkfun_SerLCD_Backlight(serlcd, fps=30)
+
+print("Example 22: Backlight Animation")
+print("Press Ctrl-C to end program.")
+
+serlcd.write_frame(["Backlight", "Animation"])
+
+# Fade to orange and then to blue, waiting for each fade to end
+backlight.fade(0xFF8C00, 2.0)
+backlight.run()
+backlight.fade(0x0000FF, 2.0)
+backlight.run()
+
+# Pulse green, updating the backlight from the main loop
+backlight.pulse(0x00FF00, 2.0)
+start = monotonic()
+
+try:
+    while True:
+        backlight.update()
+        serlcd.write_row(1, "Time: {:.1f}".format(monotonic() - start))
+
+except KeyboardInterrupt:
+    backlight.set_color(0xFFFFFF)
@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2017 Scott Shawcroft, written for Adafruit Industries
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+
+#  This is example is for the SparkFun Serial LCD displays.
+#  SparkFun sells these at its website: www.sparkfun.com
+#  Do you like this library? Help support SparkFun. Buy a board!
+#  https://www.sparkfun.com/products/14072
+#  https://www.sparkfun.com/products/14073
+#  https://www.sparkfun.com/products/14074
+
+"""
+ Serial LCD Example 23 - example23_big_numbers.py
+
+
+ Example 23 - Big Numbers:
+ This program shows a counter in large digits two rows tall
+ with a bar graph below it on a 4 row display.
+"""
+from time import sleep
+import board
+from sparkfun_serlcd import Sparkfun_SerLCD_I2C
+from sparkfun_serlcd_graphics import Sparkfun_SerLCD_BigNumber, Sparkfun_SerLCD_BarGraph
+
+i2c = board.I2C()
+serlcd = Sparkfun_SerLCD_I2C(i2c)
+big = Sparkfun_SerLCD_BigNumber(serlcd, height=2)
+bar = Sparkfun_SerLCD_BarGraph(serlcd, 0, 3, 20)
+
+print("Example 23: Big Numbers")
+print("Press Ctrl-C to end program.")
+
+serlcd.clear()
+count = 0
+
+try:
+    while True:
+        # Only the cells that change are sent each time
+        big.show("{:3d}".format(count))
+        bar.show(count, 99)
+        count = (count + 1) % 100
+        sleep(0.2)
+
+except KeyboardInterrupt:
+    serlcd.clear()
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2017 Scott Shawcroft, written for Adafruit Industries
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+
+#  This is example is for the SparkFun Serial LCD displays.
+#  SparkFun sells these at its website: www.sparkfun.com
+#  Do you like this library? Help support SparkFun. Buy a board!
+#  https://www.sparkfun.com/products/14072
+#  https://www.sparkfun.com/products/14073
+#  https://www.sparkfun.com/products/14074
+
+"""
+ Serial LCD Example 24 - example24_render_loop.py
+
+
+ Example 24 - Render Loop:
+ This program updates a counter as fast as it can, while the
+ display is sent only the newest value ten times a second.
+"""
+import board
+from sparkfun_serlcd import Sparkfun_SerLCD_I2C
+from sparkfun_serlcd_renderer import Sparkfun_SerLCD_Renderer
+
+i2c = board.I2C()
+serlcd = Sparkfun_SerLCD_I2C(i2c)
+renderer = Sparkfun_SerLCD_Renderer(serlcd, fps=10)
+
+print("Example 24: Render Loop")
+print("Press Ctrl-C to end program.")
+
+count = 0
+
+try:
+    while True:
+        count += 1
+        # Frames that are replaced before they are sent are dropped
+        renderer.submit(["Count: {}".format(count), "Sent: {}".format(renderer.sent)])
+        renderer.update()
+
+except KeyboardInterrupt:
+    print("Dropped {} frames".format(renderer.dropped))
@@ -59,5 +59,19 @@ setup(
     keywords="adafruit blinka circuitpython micropython serlcd sparkfun serial lcd display",
     # You can just specify the packages manually here if your project is
     # simple. Or you can use find_packages().
-    py_modules=["sparkfun_serlcd"],
+    py_modules=[
+        "sparkfun_serlcd",
+        "sparkfun_serlcd_transport",
+        "sparkfun_serlcd_text",
+        "sparkfun_serlcd_async",
+        "sparkfun_serlcd_backlight",
+        "sparkfun_serlcd_emulator",
+        "sparkfun_serlcd_graphics",
+        "sparkfun_serlcd_group",
+        "sparkfun_serlcd_recorder",
+        "sparkfun_serlcd_renderer",
+        "sparkfun_serlcd_settings",
+        "sparkfun_serlcd_ticker",
+        "sparkfun_serlcd_writer",
+    ],
 )
@@ -58,6 +58,17 @@ Implementation Notes
   https://github.com/adafruit/circuitpython/releases
 
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+
+* asyncio, only for the drivers in sparkfun_serlcd_async:
+  https://github.com/adafruit/Adafruit_CircuitPython_asyncio
+
+* threading, only for sparkfun_serlcd_writer on CPython and Blinka
+
+The add-ons are in their own modules, so a board only loads the ones it
+imports: sparkfun_serlcd_async, sparkfun_serlcd_backlight,
+sparkfun_serlcd_emulator, sparkfun_serlcd_graphics, sparkfun_serlcd_group,
+sparkfun_serlcd_recorder, sparkfun_serlcd_renderer, sparkfun_serlcd_settings,
+sparkfun_serlcd_ticker and sparkfun_serlcd_writer.
 """
 
 # imports__version__ = "0.0.0-auto.0"
@@ -65,14 +76,19 @@ __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
 
 # imports
-from time import sleep
 from micropython import const
+from sparkfun_serlcd_text import (  # pylint: disable=unused-import
+    ALIGN_LEFT,
+    ALIGN_CENTER,
+    ALIGN_RIGHT,
+    _ROW_COUNTS,
+    Sparkfun_SerLCD_Text,
+)
 
 # public constants
 DEFAULT_I2C_ADDR = const(0x72)
 """Default I2C address for SerLCD"""
 
-
 # private constants
 _MAX_ROWS = const(4)
 _MAX_COLS = const(20)
@@ -80,6 +96,13 @@ _MAX_COLS = const(20)
 # Character to reset display Splash Screen to default
 _DEFAULT_SPLASH_SCREEN = const(0xFF)
 
+# Size of the scratch buffer for commands, big enough for a custom character
+_SCRATCH_SIZE = const(10)
+
+# OSError errno of an I2C write whose address was not acknowledged, so no
+# byte of it reached the display
+_ENODEV = const(19)
+
 # OpenLCD command characters
 _SPECIAL_COMMAND = const(254)
 _SETTING_COMMAND = const(0x7C)
@@ -103,12 +126,45 @@ _ENABLE_SPLASH_DISPLAY = const(0x30)
 _DISABLE_SPLASH_DISPLAY = const(0x31)
 # 10, Ctrl+j, command to save current text on display as splash
 _SAVE_CURRENT_DISPLAY_AS_SPLASH = const(0x0A)
+# 9, Ctrl+i, command to toggle the splash screen at power on
+_SPLASH_TOGGLE_COMMAND = const(0x09)
+# 26, Ctrl+z, command to toggle ignoring the RX pin at power on
+_IGNORE_RX_COMMAND = const(0x1A)
 # Show firmware version
 _SHOW_VERSION_COMMAND = const(0x2C)
 # Software reset of the system
 _RESET_COMMAND = const(0x08)
+# 3-4, Ctrl+c and Ctrl+d, commands to change the width to 20 and 16
+_WIDTH_20_COMMAND = const(0x03)
+_WIDTH_16_COMMAND = const(0x04)
+# 5-7, Ctrl+e to Ctrl+g, commands to change the lines to 4, 2 and 1
+_LINES_4_COMMAND = const(0x05)
+_LINES_2_COMMAND = const(0x06)
+_LINES_1_COMMAND = const(0x07)
+# 27-34, command to create custom characters 0 to 7
+_CREATE_CHARACTER_COMMAND = const(27)
+# 35-42, command to write custom characters 0 to 7
+_WRITE_CHARACTER_COMMAND = const(35)
+# 11-23, Ctrl+k to Ctrl+w, commands to change the baud rate
+_BAUD_COMMAND = const(0x0B)
+_BAUD_RATES = (
+    2400,
+    4800,
+    9600,
+    14400,
+    19200,
+    38400,
+    57600,
+    115200,
+    230400,
+    460800,
+    921600,
+    1000000,
+    1200,
+)
 
 # special commands
+_LCD_CLEARDISPLAY = const(0x01)
 _LCD_RETURNHOME = const(0x02)
 _LCD_ENTRYMODESET = const(0x04)
 _LCD_DISPLAYCONTROL = const(0x08)
@@ -119,7 +175,6 @@ _LCD_SETDDRAMADDR = const(0x80)
 _LCD_ENTRYRIGHT = const(0x00)
 _LCD_ENTRYLEFT = const(0x02)
 _LCD_ENTRYSHIFTINCREMENT = const(0x01)
-_LCD_ENTRYSHIFTDECREMENT = const(0x00)
 
 # flags for display on/off control
 _LCD_DISPLAYON = const(0x04)
@@ -135,6 +190,7 @@ _LCD_CURSORMOVE = const(0x00)
 _LCD_MOVERIGHT = const(0x04)
 _LCD_MOVELEFT = const(0x00)
 
+
 # private functions
 
 
@@ -145,20 +201,50 @@ def _map_range(value, in_min, in_max, out_min, out_max):
     return int(result)
 
 
+# Backlight brightness 0 to 29 for each byte value of a color
+_BACKLIGHT_LEVELS = bytes(_map_range(value, 0, 255, 0, 29) for value in range(256))
+
+
 # abstract base class
-class Sparkfun_SerLCD:
+class Sparkfun_SerLCD(Sparkfun_SerLCD_Text):
     """Abstract base class for Sparkfun AVR-Based Serial LCD display.
     Use the appropriate driver communcation subclass Sparkfun_SerLCD_I2C()
     for I2C, Sparkfun_SerLCD_SPI() for SPI or Sparkfun_SerLCD_UART for UART.
+    rows - number of rows on the display: 1, 2 or 4
+    columns - number of columns on the display: 16 or 20
+    attach - True to take over a display that is already running, without
+    clearing it or resetting its modes
     """
 
     # pylint: disable=too-many-instance-attributes
     # pylint: disable=too-many-public-methods
 
-    def __init__(self):
+    def __init__(self, rows=_MAX_ROWS, columns=_MAX_COLS, attach=False):
+        super().__init__(rows, columns)
         self._display_control = _LCD_DISPLAYON | _LCD_CURSOROFF | _LCD_BLINKOFF
-        self._display_mode = _LCD_ENTRYLEFT | _LCD_ENTRYSHIFTDECREMENT
-        self._begin()
+        # Reusable buffers so that sending commands does not allocate memory,
+        # with a view of the scratch buffer for each command length
+        self._scratch = bytearray(_SCRATCH_SIZE)
+        view = memoryview(self._scratch)
+        self._views = tuple(view[:n] for n in range(_SCRATCH_SIZE + 1))
+        # Bitmaps of the custom characters in each location, and when each
+        # one was last used for the least recently used replacement
+        self._glyphs = [None] * 8
+        self._glyph_ticks = [0] * 8
+        self._glyph_clock = 0
+        # Last settings sent to the display, None when not known, and
+        # whether the display control flags are known
+        self._control_known = False
+        self._backlight = None
+        self._contrast = None
+        self._splash = None
+        self._system_messages = None
+        # The I2C address is not forgotten, as the driver is talking to it
+        self._i2c_address = None
+        # Nothing is known about a display that is already running, so
+        # everything is sent the first time it is set
+        if not attach:
+            self._begin()
 
     def command(self, command):
         # pylint: disable=line-too-long
@@ -205,40 +291,39 @@ class Sparkfun_SerLCD:
         *        / 188-217 / 0xBC-0xD9 - Set the blue backlight brightness. 188 = Off, 217 = 100%.
         * For example, to change the baud rate to 115200 send 124 followed by 18.
         """
-        data = bytearray()
-        data.append(_SETTING_COMMAND)
-        data.append(command & 0xFF)
-        self._write_bytes(data)
+        data = self._scratch
+        data[0] = _SETTING_COMMAND
+        data[1] = command & 0xFF
+        self._send(self._views[2])
 
         # Wait a bit longer for special display commands
-        sleep(0.010)
+        self._settle(0.010)
 
     def clear(self):
         """Clear the display"""
+        self._clear_shadow()
         self.command(_CLEAR_COMMAND)
 
     def home(self):
         """Send the cursor home"""
+        self._cursor_pos = 0
+        self._shifted = False
         self._special_command(_LCD_RETURNHOME)
 
-    def write(self, message):
-        """Write a character string to the display."""
-        # Value -> String -> Bytes
-        text = str(message).encode()
-        self._write_bytes(text)
-
     def set_cursor(self, col, row):
         """Set the cursor position."""
-        row_offsets = [0x00, 0x40, 0x14, 0x54]
+        # keep variables in bounds of the display
+        row = min(max(0, row), self._rows - 1)
+        col = min(max(0, col), self._cols - 1)
 
-        # keep variables in bounds
-        # row cannot be less than 0
-        row = max(0, row)
-        # row cannot be greater than max rows
-        row = min(row, _MAX_ROWS - 1)
+        position = row * self._cols + col
+        # nothing to do if the cursor is already there
+        if position == self._cursor_pos:
+            return
 
+        self._cursor_pos = position
         # send the command
-        self._special_command(_LCD_SETDDRAMADDR | (col + row_offsets[row]))
+        self._special_command(_LCD_SETDDRAMADDR | (col + self._row_offsets[row]))
 
     def create_character(self, location, charmap):
         """Create a customer character
@@ -247,16 +332,53 @@ class Sparkfun_SerLCD:
 
         # There are only 8 locations 0-7
         location &= 0x07
-        data = bytearray()
+        data = self._scratch
         # Send request to create a customer character
-        data.append(_SETTING_COMMAND)
-        data.append(27 + location)
+        data[0] = _SETTING_COMMAND
+        data[1] = _CREATE_CHARACTER_COMMAND + location
         for i in range(8):
             # Only the lowest 5 bits are used
-            data.append(charmap[i] & 0x1F)
-        self._write_bytes(data)
+            data[i + 2] = charmap[i] & 0x1F
+        self._glyphs[location] = bytes(data[2:10])
+        self._send(self._views[10])
         # This takes a bit longer
-        sleep(0.050)
+        self._settle(0.050)
+
+    def load_character(self, charmap):
+        """Load a custom character and return its location 0 to 7
+        charmap  - bytes for character as 8 x 5 bit map
+
+        Characters are kept by their bitmap, so nothing is sent when the
+        same bitmap is already loaded.  When all 8 locations are in use,
+        the least recently used character that is not on the display is
+        replaced, or the least recently used one if they all are."""
+        glyph = bytes(row & 0x1F for row in charmap[:8])
+        self._glyph_clock += 1
+        if glyph in self._glyphs:
+            location = self._glyphs.index(glyph)
+        elif None in self._glyphs:
+            location = self._glyphs.index(None)
+            self.create_character(location, glyph)
+        else:
+            ticks = self._glyph_ticks
+            by_age = sorted(range(8), key=lambda i: ticks[i])
+            # Keep characters that are shown on the display if possible
+            location = by_age[0]
+            for i in by_age:
+                if i not in self._shadow:
+                    location = i
+                    break
+            self.create_character(location, glyph)
+        self._glyph_ticks[location] = self._glyph_clock
+        return location
+
+    def write_glyph(self, charmap):
+        """Write a custom character to the display by its bitmap, loading
+        it first if needed, and return its location 0 to 7
+        charmap  - bytes for character as 8 x 5 bit map"""
+        location = self.load_character(charmap)
+        self.write_character(location)
+        return location
 
     def write_character(self, location):
         """Write a customer character to the display
@@ -265,7 +387,8 @@ class Sparkfun_SerLCD:
         # There are only locations 0-7
         location &= 0x07
 
-        self.command(35 + location)
+        self._track_text((location,))
+        self.command(_WRITE_CHARACTER_COMMAND + location)
 
     def set_backlight(self, rgb):
         """Set the backlight with 24-bit RGB value."""
@@ -276,34 +399,40 @@ class Sparkfun_SerLCD:
 
     def set_backlight_rgb(self, red, green, blue):
         """Set the backlight with byte values for r, g, b"""
+        red &= 0x00FF
+        green &= 0x00FF
+        blue &= 0x00FF
+        if not self._update_backlight(red, green, blue):
+            return
         # map the byte value range to backlight command range
-        r_value = 128 + _map_range(red, 0, 255, 0, 29)
-        g_value = 158 + _map_range(green, 0, 255, 0, 29)
-        b_value = 188 + _map_range(blue, 0, 255, 0, 29)
+        r_value = 128 + _BACKLIGHT_LEVELS[red]
+        g_value = 158 + _BACKLIGHT_LEVELS[green]
+        b_value = 188 + _BACKLIGHT_LEVELS[blue]
 
         # send commands to the display to set backlights
-        data = bytearray()
+        data = self._scratch
         # Turn display off to hide confirmation messages
         self._display_control &= ~_LCD_DISPLAYON
-        data.append(_SPECIAL_COMMAND)
-        data.append(_LCD_DISPLAYCONTROL | self._display_control)
+        data[0] = _SPECIAL_COMMAND
+        data[1] = _LCD_DISPLAYCONTROL | self._display_control
 
         # Set the red, green and blue values
-        data.append(_SETTING_COMMAND)
-        data.append(r_value)
-        data.append(_SETTING_COMMAND)
-        data.append(g_value)
-        data.append(_SETTING_COMMAND)
-        data.append(b_value)
+        data[2] = _SETTING_COMMAND
+        data[3] = r_value
+        data[4] = _SETTING_COMMAND
+        data[5] = g_value
+        data[6] = _SETTING_COMMAND
+        data[7] = b_value
 
         # Turn display back on and end
         self._display_control |= _LCD_DISPLAYON
-        data.append(_SPECIAL_COMMAND)
-        data.append(_LCD_DISPLAYCONTROL | self._display_control)
+        data[8] = _SPECIAL_COMMAND
+        data[9] = _LCD_DISPLAYCONTROL | self._display_control
+        self._control_known = True
         # Send data
-        self._write_bytes(data)
+        self._send(self._views[10])
         # This one is a bit slow
-        sleep(0.050)
+        self._settle(0.050)
 
     def set_fast_backlight(self, rgb):
         """Set the backlight color by a 24-bit value in one pass."""
@@ -319,73 +448,76 @@ class Sparkfun_SerLCD:
         red &= 0x00FF
         green &= 0x00FF
         blue &= 0x00FF
+        if not self._update_backlight(red, green, blue):
+            return
 
         # Send commands to the display to set backlights
-        data = bytearray()
-        data.append(_SETTING_COMMAND)
+        data = self._scratch
+        data[0] = _SETTING_COMMAND
         # Send the set RGB character '+' or plus
-        data.append(_SET_RGB_COMMAND)
-        data.append(red)
-        data.append(green)
-        data.append(blue)
-        self._write_bytes(data)
-        sleep(0.010)
+        data[1] = _SET_RGB_COMMAND
+        data[2] = red
+        data[3] = green
+        data[4] = blue
+        self._send(self._views[5])
+        self._settle(0.010)
 
     def display(self, value):
         """Turn the display on and off quickly."""
         if bool(value):
-            self._display_control |= _LCD_DISPLAYON
-            self._special_command(_LCD_DISPLAYCONTROL | self._display_control)
+            self._set_display_control(self._display_control | _LCD_DISPLAYON)
         else:
-            self._display_control &= ~_LCD_DISPLAYON
-            self._special_command(_LCD_DISPLAYCONTROL | self._display_control)
+            self._set_display_control(self._display_control & ~_LCD_DISPLAYON)
 
     def cursor(self, value):
         """Turn the underline cursor on and off."""
         if bool(value):
-            self._display_control |= _LCD_CURSORON
-            self._special_command(_LCD_DISPLAYCONTROL | self._display_control)
+            self._set_display_control(self._display_control | _LCD_CURSORON)
         else:
-            self._display_control &= ~_LCD_CURSORON
-            self._special_command(_LCD_DISPLAYCONTROL | self._display_control)
+            self._set_display_control(self._display_control & ~_LCD_CURSORON)
 
     def blink(self, value):
         """Turn the blink cursor on and off."""
         if bool(value):
-            self._display_control |= _LCD_BLINKON
-            self._special_command(_LCD_DISPLAYCONTROL | self._display_control)
+            self._set_display_control(self._display_control | _LCD_BLINKON)
         else:
-            self._display_control &= ~_LCD_BLINKON
-            self._special_command(_LCD_DISPLAYCONTROL | self._display_control)
+            self._set_display_control(self._display_control & ~_LCD_BLINKON)
 
     def system_messages(self, enable):
         """Enable or disable the printint of messages like 'UART: 57600' or 'Contrast: 5'"""
-        if bool(enable):
+        enable = bool(enable)
+        if enable == self._system_messages:
+            return
+        self._system_messages = enable
+        if enable:
             # Send the set '.' character
             self.command(_ENABLE_SYSTEM_MESSAGE_DISPLAY)
         else:
             # Send the set '/' character
             self.command(_DISABLE_SYSTEM_MESSAGE_DISPLAY)
-        sleep(0.010)
+        self._settle(0.010)
 
     def autoscroll(self, enable):
         """Turn autoscrolling on and off."""
         if bool(enable):
-            self._display_mode |= _LCD_ENTRYSHIFTINCREMENT
-            self._special_command(_LCD_ENTRYMODESET | self._display_mode)
+            mode = self._display_mode | _LCD_ENTRYSHIFTINCREMENT
         else:
-            self._display_mode &= ~_LCD_ENTRYSHIFTINCREMENT
-            self._special_command(_LCD_ENTRYMODESET | self._display_mode)
-        sleep(0.010)
+            mode = self._display_mode & ~_LCD_ENTRYSHIFTINCREMENT
+        if self._set_display_mode(mode):
+            self._settle(0.010)
 
     def set_contrast(self, value):
         """Set the display contrast."""
-        data = bytearray()
-        data.append(_SETTING_COMMAND)
-        data.append(_CONTRAST_COMMAND)
-        data.append(value & 0x00FF)
-        self._write_bytes(data)
-        sleep(0.010)
+        value &= 0x00FF
+        if value == self._contrast:
+            return
+        self._contrast = value
+        data = self._scratch
+        data[0] = _SETTING_COMMAND
+        data[1] = _CONTRAST_COMMAND
+        data[2] = value
+        self._send(self._views[3])
+        self._settle(0.010)
 
     def set_i2c_address(self, new_address):
         """Change the I2C Address. 0x72 is the default.
@@ -395,72 +527,140 @@ class Sparkfun_SerLCD:
         byte new_addr - new i2c address"""
         # Mask new address to byte
         new_address &= 0x00FF
+        if new_address == self._i2c_address:
+            return
+        # Send anything pending to the old address first
+        self._flush()
+        self._wait_ready()
         # Transmit to device on old address
-        data = bytearray()
-        # Send contrast command
-        data.append(_SETTING_COMMAND)
-        data.append(_ADDRESS_COMMAND)  # 0x19
-        data.append(new_address)
-        self._write_bytes(data)
+        data = self._scratch
+        # Send address command
+        data[0] = _SETTING_COMMAND
+        data[1] = _ADDRESS_COMMAND  # 0x19
+        data[2] = new_address
+        self._count_bytes(3)
+        self._transfer(self._views[3])
         # Update our own address so we can still talk to the display
         self._change_i2c_address(new_address)
+        self._i2c_address = new_address
 
         # This may take awhile
-        sleep(0.050)
+        self._settle(0.050)
+
+    def set_geometry(self, rows, columns):
+        """Set the number of rows and columns of the display.
+        Note that this change is persistent.  The text on the display is
+        not kept, so write it again afterwards.
+
+        int rows - 1, 2 or 4
+        int columns - 16 or 20"""
+        self._resize(rows, columns)
+        if columns == 20:
+            self.command(_WIDTH_20_COMMAND)
+        else:
+            self.command(_WIDTH_16_COMMAND)
+        self.command(_LINES_1_COMMAND - _ROW_COUNTS.index(rows))
+        self._settle(0.050)
 
     def scroll_display_left(self, count=1):
         """Scroll the display to the left"""
         self._special_command(
             _LCD_CURSORSHIFT | _LCD_DISPLAYMOVE | _LCD_MOVELEFT, count
         )
+        # Cells are no longer shown at their own positions
+        self._shifted = True
 
     def scroll_display_right(self, count=1):
         """Scroll the display to the right"""
         self._special_command(
             _LCD_CURSORSHIFT | _LCD_DISPLAYMOVE | _LCD_MOVERIGHT, count
         )
+        # Cells are no longer shown at their own positions
+        self._shifted = True
 
     def move_cursor_left(self, count=1):
         """Move the cursor to the left"""
         self._special_command(_LCD_CURSORSHIFT | _LCD_CURSORMOVE | _LCD_MOVELEFT, count)
+        self._cursor_pos = None
 
     def move_cursor_right(self, count=1):
         """Scroll the display to the right"""
         self._special_command(
             _LCD_CURSORSHIFT | _LCD_CURSORMOVE | _LCD_MOVERIGHT, count
         )
+        self._cursor_pos = None
 
     def splash_screen(self, enable):
         """Enable or disable the splash screem."""
-        if bool(enable):
+        enable = bool(enable)
+        if enable == self._splash:
+            return
+        self._splash = enable
+        if enable:
             self.command(_ENABLE_SPLASH_DISPLAY)
         else:
             self.command(_DISABLE_SPLASH_DISPLAY)
-        sleep(0.010)
+        self._settle(0.010)
+
+    @property
+    def settings(self):
+        """Dictionary of the settings the display keeps when it is turned
+        off, for those that are known: backlight, contrast, splash,
+        system_messages and i2c_address."""
+        settings = {
+            "backlight": self._backlight,
+            "contrast": self._contrast,
+            "splash": self._splash,
+            "system_messages": self._system_messages,
+            "i2c_address": self._i2c_address,
+        }
+        return {name: value for name, value in settings.items() if value is not None}
+
+    def assume_settings(self, settings):
+        """Tell the driver the display already has the settings in a
+        dictionary like the one from the settings property, so setting the
+        same value again sends nothing.  Nothing is sent to the display.
+        For a display taken over with attach=True, the dictionary can also
+        hold its modes, which are not kept when it is turned off:
+        display_control - 4 when the display is on, plus 2 for the
+        underline cursor and 1 for the blink cursor
+        entry_mode - 2 when text flows left to right, plus 1 for autoscroll
+        so that turning on a mode the display already has sends nothing."""
+        if "display_control" in settings:
+            self._display_control = settings["display_control"] & 0x07
+            self._control_known = True
+        if "entry_mode" in settings:
+            self._display_mode = settings["entry_mode"] & 0x03
+            self._mode_known = True
+        self._backlight = settings.get("backlight", self._backlight)
+        self._contrast = settings.get("contrast", self._contrast)
+        self._splash = settings.get("splash", self._splash)
+        self._system_messages = settings.get("system_messages", self._system_messages)
+        self._i2c_address = settings.get("i2c_address", self._i2c_address)
 
     def save_splash_screen(self):
         """Save the current display as the splash screem."""
         self.command(_SAVE_CURRENT_DISPLAY_AS_SPLASH)
-        sleep(0.010)
+        self._settle(0.010)
 
     def left_to_right(self):
         """Set the text to flow from left to right.  This is the direction
         that is common to most Western languages."""
-        self._display_mode |= _LCD_ENTRYLEFT
-        self._special_command(_LCD_ENTRYMODESET | self._display_mode)
+        self._set_display_mode(self._display_mode | _LCD_ENTRYLEFT)
 
     def right_to_left(self):
         """Set the text to flow from right to left."""
-        self._display_mode &= ~_LCD_ENTRYLEFT
-        self._special_command(_LCD_ENTRYMODESET | self._display_mode)
+        self._set_display_mode(self._display_mode & ~_LCD_ENTRYLEFT)
 
     def show_version(self):
         """Show the firmware version on the display."""
         self.command(_SHOW_VERSION_COMMAND)
+        self._invalidate_shadow()
 
     def reset(self):
         """Perform a software reset on the dislay."""
         self.command(_RESET_COMMAND)
+        self._forget_state()
 
     def default_splash_screen(self):
         """Result to the default splash screen"""
@@ -469,14 +669,22 @@ class Sparkfun_SerLCD:
         # put the default charater
         self._put_char(_DEFAULT_SPLASH_SCREEN)
         # Wait a bit
-        sleep(0.200)
+        self._settle(0.200)
         self.save_splash_screen()
+        self._invalidate_shadow()
+
+    def play(self, sequence):
+        """Send a Sparkfun_SerLCD_Sequence made by Sparkfun_SerLCD_Recorder
+        to the display in one write."""
+        self._send(sequence.data)
+        self._settle(sequence.settle)
+        # The sequence may have changed anything on the display, including
+        # the custom characters
+        self._forget_state()
+        self._glyphs = [None] * 8
 
     # abstract methods
 
-    def _write_bytes(self, data):
-        pass
-
     def _change_i2c_address(self, addr):
         pass
 
@@ -484,79 +692,205 @@ class Sparkfun_SerLCD:
 
     def _begin(self):
         """Initialize the display"""
-        data = bytearray()
+        data = self._scratch
         # Send special command character
-        data.append(_SPECIAL_COMMAND)
+        data[0] = _SPECIAL_COMMAND
         # Send the display command
-        data.append(_LCD_DISPLAYCONTROL | self._display_control)
+        data[1] = _LCD_DISPLAYCONTROL | self._display_control
         # Send special command character
-        data.append(_SPECIAL_COMMAND)
+        data[2] = _SPECIAL_COMMAND
         # Send the entry mode command
-        data.append(_LCD_ENTRYMODESET | self._display_mode)
+        data[3] = _LCD_ENTRYMODESET | self._display_mode
         # Put LCD into setting mode
-        data.append(_SETTING_COMMAND)
+        data[4] = _SETTING_COMMAND
         # Send clear display command
-        data.append(_CLEAR_COMMAND)
-        self._write_bytes(data)
-        sleep(0.050)
+        data[5] = _CLEAR_COMMAND
+        self._control_known = True
+        self._mode_known = True
+        self._clear_shadow()
+        self._send(self._views[6])
+        self._settle(0.050)
+
+    def _set_display_control(self, control):
+        """Send the display on/off control flags, if they changed."""
+        if self._control_known and control == self._display_control:
+            return
+        self._display_control = control
+        self._control_known = True
+        self._special_command(_LCD_DISPLAYCONTROL | control)
+
+    def _set_display_mode(self, mode):
+        """Send the entry mode flags if they changed, and return True
+        if they were sent."""
+        if self._mode_known and mode == self._display_mode:
+            return False
+        self._display_mode = mode
+        self._mode_known = True
+        self._special_command(_LCD_ENTRYMODESET | mode)
+        return True
+
+    def _update_backlight(self, red, green, blue):
+        """Record a new backlight color and return True if it changed."""
+        rgb = (red << 16) | (green << 8) | blue
+        if rgb == self._backlight:
+            return False
+        self._backlight = rgb
+        return True
+
+    def _forget_state(self):
+        """Forget all the settings and text known to be on the display."""
+        self._control_known = False
+        self._mode_known = False
+        self._backlight = None
+        self._contrast = None
+        self._splash = None
+        self._system_messages = None
+        self._shifted = True
+        self._invalidate_shadow()
 
     def _special_command(self, command, count=1):
         """Send a special command to the display.  Used by other functions."""
-        data = bytearray()
-        data.append(_SPECIAL_COMMAND)
-        for _ in range(count):
-            data.append(command & 0xFF)
-        self._write_bytes(data)
+        # The display takes one command after each special command character
+        size = 2 * count
+        data = self._scratch if size <= _SCRATCH_SIZE else bytearray(size)
+        for i in range(0, size, 2):
+            data[i] = _SPECIAL_COMMAND
+            data[i + 1] = command & 0xFF
+        if data is self._scratch:
+            self._send(self._views[size])
+        else:
+            self._send(data)
 
         # Wait a bit longer for special display commands
-        sleep(0.050)
+        self._settle(0.050)
 
     def _put_char(self, char):
         """Send a character byte directly to display, no encoding"""
-        data = bytearray()
-        data.append(char & 0xFF)
-        self._write_bytes(data)
+        data = self._scratch
+        data[0] = char & 0xFF
+        self._send(self._views[1])
 
 
 # concrete subclass for I2C
 class Sparkfun_SerLCD_I2C(Sparkfun_SerLCD):
     """Driver subclass for Sparkfun Serial Displays over I2C communication"""
 
-    def __init__(self, i2c, address=DEFAULT_I2C_ADDR):
+    # The I2C receive buffer on the display is only 32 bytes
+    _chunk_size = 32
+    # Times a failed write is tried again, and the first and longest
+    # seconds to wait before trying
+    _retries = 3
+    _backoff = 0.001
+    _max_backoff = 0.064
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        i2c,
+        address=DEFAULT_I2C_ADDR,
+        rows=_MAX_ROWS,
+        columns=_MAX_COLS,
+        attach=False,
+    ):
+        # Imported here, so only the drivers that use a bus device load it
         # pylint: disable=import-outside-toplevel
-        import adafruit_bus_device.i2c_device as i2c_device
+        from adafruit_bus_device import i2c_device
 
         self._i2c_device = i2c_device.I2CDevice(i2c, address)
         self._i2c = i2c
-        super().__init__()
+        # Writes that raised an error, and those given up after every retry
+        self.bus_errors = 0
+        self.bus_failures = 0
+        super().__init__(rows, columns, attach)
+        self._i2c_address = address
+
+    def set_retry_policy(self, retries=None, backoff=None, max_backoff=None):
+        """Set how writes that fail on a busy bus are tried again.
+        retries - times a failed write is tried again before giving up
+        backoff - seconds to wait before the first retry, doubled for each
+        retry after that
+        max_backoff - longest wait in seconds between retries
+        Any of them can be None to leave it as is.  A write that still fails
+        raises the error, and the error counts are kept in bus_errors and
+        bus_failures.
+        A write is resent whole, and when part of it may already have
+        reached the display, the text, settings and custom characters on
+        the display are treated as unknown, so the next updates are sent in
+        full."""
+        if retries is not None:
+            self._retries = retries
+        if backoff is not None:
+            self._backoff = backoff
+        if max_backoff is not None:
+            self._max_backoff = max_backoff
 
     def _write_bytes(self, data):
-        with self._i2c_device as device:
-            device.write(data)
+        held = self._held_device(len(data))
+        delay = self._backoff
+        for attempt in range(self._retries + 1):
+            try:
+                if held is None:
+                    with self._i2c_device as device:
+                        device.write(data)
+                else:
+                    held.write(data)
+                break
+            except OSError as error:
+                self.bus_errors += 1
+                # Unless the display did not answer to its address, part of
+                # the write may have reached it.  OpenLCD has no way to
+                # resync, so the resent bytes can repeat text or be taken as
+                # the arguments of a cut off command.  The text and settings
+                # on the display are then no longer known, and the next
+                # updates are sent in full, which puts them right.  A cut off
+                # custom character is uploaded again when next loaded.
+                if attempt == self._retries or error.errno != _ENODEV:
+                    self._forget_state()
+                    self._glyphs = [None] * 8
+                if attempt == self._retries:
+                    self.bus_failures += 1
+                    raise
+                self._pause(delay)
+                if held is not None:
+                    held = self._session.device
+                delay = min(delay * 2, self._max_backoff)
 
     def _change_i2c_address(self, addr):
-        # pylint: disable=import-outside-toplevel
-        import adafruit_bus_device.i2c_device as i2c_device
+        # Same device class as before, without importing it again
+        self._i2c_device = type(self._i2c_device)(self._i2c, addr)
+        # Keep holding the bus in a session, with the new address
+        if self._session.device is not None:
+            self._session.release()
+            self._session.acquire()
 
-        self._i2c_device = i2c_device.I2CDevice(self._i2c, addr)
+    def _bus_device(self):
+        return self._i2c_device
 
 
 # concrete subclass for SPI
 class Sparkfun_SerLCD_SPI(Sparkfun_SerLCD):
     """Driver subclass for Sparkfun Serial LCD display over SPI communication"""
 
-    def __init__(self, spi, cs):
+    # pylint: disable=too-many-arguments
+    def __init__(self, spi, cs, rows=_MAX_ROWS, columns=_MAX_COLS, attach=False):
         # pylint: disable=import-outside-toplevel
-        import adafruit_bus_device.spi_device as spi_device
+        from adafruit_bus_device import spi_device
 
         self._spi_device = spi_device.SPIDevice(spi, cs)
-        super().__init__()
+        super().__init__(rows, columns, attach)
 
     def _write_bytes(self, data):
+        held = self._held_device(len(data))
+        if held is not None:
+            held.write(data)
+            return
         with self._spi_device as device:
             # pylint: disable=no-member
             device.write(data)
 
+    def _bus_device(self):
+        return self._spi_device
+
     def _change_i2c_address(self, addr):
         # No i2c address change for SPI
         pass
@@ -566,13 +900,38 @@ class Sparkfun_SerLCD_SPI(Sparkfun_SerLCD):
 class Sparkfun_SerLCD_UART(Sparkfun_SerLCD):
     """Driver subclass for Sparkfun Serial LCD display over Serial communication"""
 
-    def __init__(self, uart):
+    def __init__(self, uart, rows=_MAX_ROWS, columns=_MAX_COLS, attach=False):
         self._uart = uart
-        super().__init__()
+        super().__init__(rows, columns, attach)
 
     def _write_bytes(self, data):
         self._uart.write(data)
 
+    def set_baud_rate(self, baud):
+        """Change the baud rate of the display and switch the uart to match.
+        Note that this change is persistent.  If the uart cannot run at the
+        new rate, an emergency reset sets the display back to 9600 baud.
+
+        int baud - 1200, 2400, 4800, 9600, 14400, 19200, 38400, 57600,
+        115200, 230400, 460800, 921600 or 1000000"""
+        if baud not in _BAUD_RATES:
+            raise ValueError("Unsupported baud rate")
+        # Send anything pending at the old rate first
+        self._flush()
+        self._wait_ready()
+        data = self._scratch
+        data[0] = _SETTING_COMMAND
+        data[1] = _BAUD_COMMAND + _BAUD_RATES.index(baud)
+        self._count_bytes(2)
+        self._transfer(self._views[2])
+        # Let the command go out at the old rate before switching.  This
+        # waits even inside a batch, where _settle() would only queue it.
+        self._wait_ready()
+        self._pause(0.050)
+        self._uart.baudrate = baud
+        if self._uart.baudrate != baud:
+            raise RuntimeError("Could not set the uart to the new baud rate")
+
     def _change_i2c_address(self, addr):
         # No i2c address change for UART
         pass
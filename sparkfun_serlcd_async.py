@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_async`
+================================================================================
+
+asyncio drivers for the Sparkfun Serial LCD displays
+
+
+* Author(s): Gaston Williams
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* asyncio: https://github.com/adafruit/Adafruit_CircuitPython_asyncio
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+# imports
+from micropython import const
+from sparkfun_serlcd import (
+    DEFAULT_I2C_ADDR,
+    Sparkfun_SerLCD_I2C,
+    Sparkfun_SerLCD_SPI,
+    Sparkfun_SerLCD_UART,
+)
+
+# private constants
+_MAX_ROWS = const(4)
+_MAX_COLS = const(20)
+
+# Calls that write to the display at once, even inside a batch
+_IMMEDIATE_CALLS = ("set_i2c_address", "set_baud_rate")
+
+
+class _AsyncBatch:
+    """Async context manager returned by Sparkfun_SerLCD_Async.batch()"""
+
+    def __init__(self, serlcd):
+        self._serlcd = serlcd
+
+    async def __aenter__(self):
+        # pylint: disable=protected-access
+        await self._serlcd._enter()
+        return self._serlcd
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # pylint: disable=protected-access
+        await self._serlcd._exit()
+
+
+class Sparkfun_SerLCD_Async:
+    """Base class for the asyncio Sparkfun AVR-Based Serial LCD display drivers.
+    Use the appropriate driver communication subclass Sparkfun_SerLCD_I2C_Async()
+    for I2C, Sparkfun_SerLCD_SPI_Async() for SPI or Sparkfun_SerLCD_UART_Async()
+    for UART.
+
+    Every public method of Sparkfun_SerLCD is available as a coroutine.  Each
+    call is sent as one batch, and the waits for the display before the batch
+    and between its chunks use asyncio.sleep(), so the time the display needs
+    does not block the event loop.  Two waits still do: set_baud_rate()
+    sleeps for the 50 ms the display needs before the uart can switch, and
+    the I2C driver sleeps between the retries of a failed write, for the
+    backoff set by set_retry_policy().
+
+    await serlcd.set_cursor(0, 1)
+    await serlcd.write("Hello")"""
+
+    def __init__(self, lcd):
+        try:
+            # pylint: disable=import-outside-toplevel
+            from asyncio import Lock, current_task, sleep as async_sleep
+        except ImportError as error:
+            raise RuntimeError("Sparkfun_SerLCD_Async requires asyncio") from error
+        self._lcd = lcd
+        self._sleep = async_sleep
+        self._current_task = current_task
+        # Keeps the batch of one task from mixing with another task's
+        self._lock = Lock()
+        self._owner = None
+        self._depth = 0
+
+    def __getattr__(self, name):
+        attr = getattr(self._lcd, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        async def method(*args, **kwargs):
+            await self._enter()
+            try:
+                if name in _IMMEDIATE_CALLS:
+                    await self._drain()
+                return attr(*args, **kwargs)
+            finally:
+                await self._exit()
+
+        return method
+
+    def batch(self):
+        """Collect display commands into a single transfer.
+        Use as an async context manager.
+
+        async with serlcd.batch():
+            await serlcd.set_cursor(0, 0)
+            await serlcd.write("Hello")"""
+        return _AsyncBatch(self)
+
+    async def wait(self):
+        """Wait without blocking until the display has had time to process
+        the last command."""
+        delay = self._lcd.wait_time
+        if delay > 0:
+            await self._sleep(delay)
+
+    async def _enter(self):
+        """Start collecting commands into the batch of the outermost call"""
+        task = self._current_task()
+        if self._owner is not task:
+            await self._lock.acquire()
+            self._owner = task
+        self._depth += 1
+        self._lcd._batch_depth += 1  # pylint: disable=protected-access
+
+    async def _exit(self):
+        """Send the batch when the outermost call ends"""
+        lcd = self._lcd
+        # pylint: disable=protected-access
+        lcd._batch_depth -= 1
+        self._depth -= 1
+        if self._depth:
+            return
+        try:
+            if lcd._batch_depth == 0:
+                await self._flush()
+        finally:
+            self._owner = None
+            self._lock.release()
+
+    async def _drain(self):
+        """Send the pending batch and wait for the display without
+        blocking, so a call that writes at once has nothing to wait for"""
+        lcd = self._lcd
+        # pylint: disable=protected-access
+        depth = lcd._batch_depth
+        lcd._batch_depth = 0
+        try:
+            await self._flush()
+        finally:
+            lcd._batch_depth = depth
+        await self.wait()
+
+    async def _flush(self):
+        """Send the pending batch of the driver, waiting for the display
+        before each chunk without blocking."""
+        lcd = self._lcd
+        # pylint: disable=protected-access
+        data = bytes(lcd._pending)
+        del lcd._pending[:]
+        settle = lcd._pending_settle
+        lcd._pending_settle = 0
+        size = len(data)
+        chunk_size = lcd._chunk_size or size
+        for start in range(0, size, chunk_size):
+            await self.wait()
+            lcd._write_paced(data[start : start + chunk_size])
+        if settle:
+            lcd._settle(settle)
+
+
+class Sparkfun_SerLCD_I2C_Async(Sparkfun_SerLCD_Async):
+    """Asyncio driver for Sparkfun Serial Displays over I2C communication"""
+
+    def __init__(
+        self,
+        i2c,
+        address=DEFAULT_I2C_ADDR,
+        rows=_MAX_ROWS,
+        columns=_MAX_COLS,
+        attach=False,
+    ):  # pylint: disable=too-many-arguments
+        super().__init__(Sparkfun_SerLCD_I2C(i2c, address, rows, columns, attach))
+
+
+class Sparkfun_SerLCD_SPI_Async(Sparkfun_SerLCD_Async):
+    """Asyncio driver for Sparkfun Serial LCD display over SPI communication"""
+
+    def __init__(self, spi, cs, rows=_MAX_ROWS, columns=_MAX_COLS, attach=False):
+        # pylint: disable=too-many-arguments
+        super().__init__(Sparkfun_SerLCD_SPI(spi, cs, rows, columns, attach))
+
+
+class Sparkfun_SerLCD_UART_Async(Sparkfun_SerLCD_Async):
+    """Asyncio driver for Sparkfun Serial LCD display over Serial communication"""
+
+    def __init__(self, uart, rows=_MAX_ROWS, columns=_MAX_COLS, attach=False):
+        super().__init__(Sparkfun_SerLCD_UART(uart, rows, columns, attach))
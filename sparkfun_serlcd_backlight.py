@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_backlight`
+================================================================================
+
+Backlight animation for the Sparkfun Serial LCD displays
+
+
+* Author(s): Gaston Williams
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+# imports
+from sparkfun_serlcd_transport import monotonic_ns, next_frame_time, sleep_until
+
+
+class Sparkfun_SerLCD_Backlight:
+    """Animate the RGB backlight of a Sparkfun Serial LCD display with
+    fades, pulses and color palettes.
+    lcd - Sparkfun_SerLCD driver object
+    fps - most backlight updates sent per second
+    gamma - gamma correction, so fades look even to the eye
+
+    Each animation is worked out ahead of time as a list of gamma corrected
+    colors.  update() sends the next color when it is due and returns at
+    once, so it can be called from the main loop.  Steps that would not
+    change the color are not sent.
+
+    backlight = Sparkfun_SerLCD_Backlight(serlcd)
+    backlight.pulse(0x00FF00, 2.0)
+    while True:
+        backlight.update()"""
+
+    # gamma tables already worked out, by gamma
+    _tables = {}
+
+    def __init__(self, lcd, fps=30, gamma=2.2):
+        self._lcd = lcd
+        self.fps = fps
+        self._gamma = self._gamma_table(gamma)
+        # colors are kept before gamma correction, packed as 0xRRGGBB
+        self._color = 0xFFFFFF
+        self._frames = ()
+        self._index = 0
+        self._repeat = False
+        self._next_frame = 0
+        self._sent = None
+
+    @property
+    def active(self):
+        """True while an animation is running."""
+        return self._index < len(self._frames)
+
+    def set_color(self, rgb):
+        """Stop any animation and set the backlight to a 24-bit color."""
+        self._start((rgb,), False)
+        self.update()
+
+    def fade(self, rgb, duration):
+        """Fade from the current color to a 24-bit color over duration seconds."""
+        steps = max(1, int(duration * self.fps))
+        self._start(self._blend(self._color, rgb, steps), False)
+
+    def pulse(self, rgb, period, low=0x000000, repeat=True):
+        """Fade between a low and a high 24-bit color and back again,
+        taking period seconds, over and over unless repeat is False."""
+        steps = max(1, int(period * self.fps / 2))
+        rising = self._blend(low, rgb, steps)
+        falling = self._blend(rgb, low, steps)
+        self._start(rising + falling, repeat)
+
+    def palette(self, colors, hold, fade=0, repeat=True):
+        """Step through a list of 24-bit colors, showing each one for hold
+        seconds and fading for fade seconds between them."""
+        steps = int(fade * self.fps)
+        frames = []
+        for i, rgb in enumerate(colors):
+            if steps and (i or repeat):
+                frames.extend(self._blend(colors[i - 1], rgb, steps))
+            # hold each color by repeating it, repeats are not sent
+            frames.extend([rgb] * max(1, int(hold * self.fps)))
+        self._start(frames, repeat)
+
+    def stop(self):
+        """Stop the animation, leaving the backlight as it is."""
+        self._frames = ()
+        self._index = 0
+
+    def update(self):
+        """Send the next color if it is due.  Returns True while an
+        animation is running."""
+        if not self.active:
+            return False
+        now = monotonic_ns()
+        if now < self._next_frame:
+            return True
+        self._next_frame = next_frame_time(self._next_frame, now, self.fps)
+        rgb = self._frames[self._index]
+        self._index += 1
+        if self._index >= len(self._frames) and self._repeat:
+            self._index = 0
+        self._show(rgb)
+        return self.active
+
+    def run(self):
+        """Run the animation until it ends.  Returns at once for an
+        animation that repeats."""
+        while not self._repeat and self.update():
+            sleep_until(self._next_frame)
+
+    @classmethod
+    def _gamma_table(cls, gamma):
+        """Table of the gamma corrected value of each byte"""
+        table = cls._tables.get(gamma)
+        if table is None:
+            table = bytes(
+                int(255 * (value / 255) ** gamma + 0.5) for value in range(256)
+            )
+            cls._tables[gamma] = table
+        return table
+
+    @staticmethod
+    def _blend(start, end, steps):
+        """List of colors from start to end, not including start"""
+        frames = []
+        for step in range(1, steps + 1):
+            rgb = 0
+            for shift in (16, 8, 0):
+                first = (start >> shift) & 0xFF
+                last = (end >> shift) & 0xFF
+                rgb |= (first + (last - first) * step // steps) << shift
+            frames.append(rgb)
+        return frames
+
+    def _start(self, frames, repeat):
+        """Start a new animation"""
+        self._frames = frames
+        self._index = 0
+        self._repeat = repeat
+        self._next_frame = monotonic_ns()
+
+    def _show(self, rgb):
+        """Send a color to the display, unless it is already showing"""
+        self._color = rgb
+        gamma = self._gamma
+        red = gamma[(rgb >> 16) & 0xFF]
+        green = gamma[(rgb >> 8) & 0xFF]
+        blue = gamma[rgb & 0xFF]
+        corrected = (red << 16) | (green << 8) | blue
+        if corrected != self._sent:
+            self._sent = corrected
+            self._lcd.set_fast_backlight_rgb(red, green, blue)
@@ -0,0 +1,357 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_emulator`
+================================================================================
+
+Emulated OpenLCD display for testing the Sparkfun Serial LCD drivers
+
+
+* Author(s): Gaston Williams
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+# imports
+from micropython import const
+from sparkfun_serlcd import DEFAULT_I2C_ADDR, _BAUD_RATES
+from sparkfun_serlcd_text import _ROW_COUNTS
+from sparkfun_serlcd_transport import monotonic_ns
+
+# private constants
+_MAX_ROWS = const(4)
+_MAX_COLS = const(20)
+# Blank character, the contents of the display after a clear
+_BLANK_CELL = const(0x20)
+
+# OpenLCD command characters
+_SPECIAL_COMMAND = const(254)
+_SETTING_COMMAND = const(0x7C)
+
+# OpenLCD setting commands, in order of their codes
+_WIDTH_20_COMMAND = const(0x03)  # Ctrl+c, 20 columns
+_WIDTH_16_COMMAND = const(0x04)  # Ctrl+d, 16 columns
+_LINES_4_COMMAND = const(0x05)  # Ctrl+e to Ctrl+g, 4, 2 and 1 lines
+_LINES_1_COMMAND = const(0x07)
+_RESET_COMMAND = const(0x08)  # software reset
+_SPLASH_TOGGLE_COMMAND = const(0x09)  # Ctrl+i, toggle the splash screen
+_SAVE_CURRENT_DISPLAY_AS_SPLASH = const(0x0A)  # Ctrl+j
+_BAUD_COMMAND = const(0x0B)  # Ctrl+k to Ctrl+w, baud rates
+_CONTRAST_COMMAND = const(0x18)  # contrast, one argument
+_ADDRESS_COMMAND = const(0x19)  # i2c address, one argument
+_IGNORE_RX_COMMAND = const(0x1A)  # Ctrl+z, toggle ignoring the RX pin
+_CREATE_CHARACTER_COMMAND = const(0x1B)  # 27-34, eight arguments
+_WRITE_CHARACTER_COMMAND = const(0x23)  # 35-42, custom characters 0 to 7
+_SET_RGB_COMMAND = const(0x2B)  # +, backlight RGB, three arguments
+_SHOW_VERSION_COMMAND = const(0x2C)  # firmware version
+_CLEAR_COMMAND = const(0x2D)  # -, clear and home the display
+_ENABLE_SYSTEM_MESSAGE_DISPLAY = const(0x2E)  # .
+_DISABLE_SYSTEM_MESSAGE_DISPLAY = const(0x2F)  # /
+_ENABLE_SPLASH_DISPLAY = const(0x30)  # 0
+_DISABLE_SPLASH_DISPLAY = const(0x31)  # 1
+
+# special commands
+_LCD_CLEARDISPLAY = const(0x01)
+_LCD_ENTRYMODESET = const(0x04)
+_LCD_DISPLAYCONTROL = const(0x08)
+_LCD_CURSORSHIFT = const(0x10)
+_LCD_SETDDRAMADDR = const(0x80)
+
+# flags for display entry mode, on/off control and display/cursor shift
+_LCD_ENTRYLEFT = const(0x02)
+_LCD_ENTRYSHIFTINCREMENT = const(0x01)
+_LCD_DISPLAYON = const(0x04)
+_LCD_DISPLAYMOVE = const(0x08)
+_LCD_MOVERIGHT = const(0x04)
+
+# What the parser expects next: text, a setting command, a special
+# command or the arguments of a setting command
+_EMULATOR_TEXT = const(0)
+_EMULATOR_SETTING = const(1)
+_EMULATOR_SPECIAL = const(2)
+_EMULATOR_ARGUMENTS = const(3)
+
+
+class OpenLCD_Emulator:
+    """Emulated Sparkfun Serial LCD display for testing without hardware.
+    Pass it to Sparkfun_SerLCD_UART() in place of a uart.  It parses the
+    bytes sent by the driver the way the OpenLCD firmware does, and keeps
+    the text, cursor, custom characters, backlight and other settings of
+    the display.
+
+    Each byte takes time on the wire at the baud rate, and each command
+    keeps the emulated display busy for about as long as the real one.
+    Bytes that arrive while the receive buffer is full are dropped and
+    counted in overruns, just like on the real display.  Bytes sent while
+    baudrate does not match display_baudrate are garbled, so they are
+    dropped and counted in framing_errors.
+
+    rows, columns - size of the display
+    clock - function that returns the time in nanoseconds"""
+
+    # pylint: disable=too-many-instance-attributes
+
+    # Approximate time in seconds that the display is busy with each command
+    char_time = 0.0001
+    command_time = 0.0001
+    clear_time = 0.002
+    setting_time = 0.004
+    message_time = 0.5
+    reset_time = 0.5
+    # Size of the OpenLCD receive buffer
+    rx_buffer_size = 64
+
+    def __init__(self, rows=_MAX_ROWS, columns=_MAX_COLS, clock=monotonic_ns):
+        self.rows = rows
+        self.columns = columns
+        self.baudrate = 9600
+        self._clock = clock
+
+        # display state
+        self.ddram = bytearray(b" " * 0x80)
+        self.cgram = [bytes(8)] * 8
+        self.address = 0
+        self.shift = 0
+        self.display_control = _LCD_DISPLAYON
+        self.entry_mode = _LCD_ENTRYLEFT
+        self.backlight = [255, 255, 255]
+        self.contrast = 40
+        self.i2c_address = DEFAULT_I2C_ADDR
+        self.splash = True
+        self.splash_text = None
+        self.system_messages = True
+        self.ignore_rx = False
+        self.display_baudrate = 9600
+
+        # counters
+        self.bytes_received = 0
+        self.commands = 0
+        self.busy_time = 0.0
+        self.wire_time = 0.0
+        self.overruns = 0
+        self.framing_errors = 0
+
+        # parser and timing state
+        self._mode = _EMULATOR_TEXT
+        self._command = 0
+        self._needed = 0
+        self._arguments = bytearray()
+        self._line_free = 0
+        self._ready_at = 0
+        self._queue = []
+
+    def write(self, data):
+        """Receive bytes from the driver, like uart.write()"""
+        byte_time = int(10000000000 / self.baudrate)
+        arrival = max(self._clock(), self._line_free)
+        queue = self._queue
+        for byte in data:
+            arrival += byte_time
+            self.bytes_received += 1
+            # bytes waiting in the receive buffer
+            while queue and queue[0] <= arrival:
+                queue.pop(0)
+            if len(queue) >= self.rx_buffer_size:
+                self.overruns += 1
+                continue
+            if self.baudrate != self.display_baudrate:
+                self.framing_errors += 1
+                continue
+            duration = self._receive(byte)
+            self.busy_time += duration
+            self._ready_at = max(arrival, self._ready_at) + int(duration * 1000000000)
+            queue.append(self._ready_at)
+        self.wire_time += len(data) * byte_time / 1000000000
+        self._line_free = arrival
+        return len(data)
+
+    @property
+    def busy(self):
+        """True while the display is still processing received bytes."""
+        return self._clock() < self._ready_at
+
+    @property
+    def text(self):
+        """List of the rows of text shown on the display.  Custom
+        characters are shown as the characters 0 to 7."""
+        return [
+            "".join(
+                chr(self.ddram[self._cell(row, col)]) for col in range(self.columns)
+            )
+            for row in range(self.rows)
+        ]
+
+    @property
+    def cursor(self):
+        """The (column, row) of the cursor, or None if it is off the display."""
+        for row in range(self.rows):
+            col = self.address - self._row_offset(row)
+            if 0 <= col < self.columns:
+                return (col, row)
+        return None
+
+    def _row_offset(self, row):
+        """DDRAM address of the first column of a row"""
+        return (row & 1) * 0x40 + (row >> 1) * self.columns
+
+    def _cell(self, row, col):
+        """DDRAM address shown at a row and column"""
+        offset = self._row_offset(row)
+        line = offset & 0x40
+        return line | ((offset - line + col + self.shift) % 40)
+
+    def _receive(self, byte):
+        """Parse a byte and return how long the display is busy with it."""
+        # pylint: disable=too-many-return-statements
+        if self._mode == _EMULATOR_SPECIAL:
+            self._mode = _EMULATOR_TEXT
+            self.commands += 1
+            return self._special(byte)
+
+        if self._mode == _EMULATOR_SETTING:
+            self._mode = _EMULATOR_TEXT
+            self._command = byte
+            self._needed = 0
+            if byte in (_CONTRAST_COMMAND, _ADDRESS_COMMAND):
+                self._needed = 1
+            elif byte == _SET_RGB_COMMAND:
+                self._needed = 3
+            elif 0 <= byte - _CREATE_CHARACTER_COMMAND < 8:
+                self._needed = 8
+            if self._needed:
+                self._mode = _EMULATOR_ARGUMENTS
+                del self._arguments[:]
+                return 0
+            self.commands += 1
+            return self._setting(byte, None)
+
+        if self._mode == _EMULATOR_ARGUMENTS:
+            self._arguments.append(byte)
+            if len(self._arguments) < self._needed:
+                return 0
+            self._mode = _EMULATOR_TEXT
+            self.commands += 1
+            return self._setting(self._command, self._arguments)
+
+        if byte == _SETTING_COMMAND:
+            self._mode = _EMULATOR_SETTING
+            return 0
+        if byte == _SPECIAL_COMMAND:
+            self._mode = _EMULATOR_SPECIAL
+            return 0
+        self._put(byte)
+        return self.char_time
+
+    def _put(self, char):
+        """Write a character at the cursor and move the cursor on."""
+        self.ddram[self.address] = char
+        increment = self.entry_mode & _LCD_ENTRYLEFT
+        if self.entry_mode & _LCD_ENTRYSHIFTINCREMENT:
+            self.shift += 1 if increment else -1
+        if not increment:
+            self._move_cursor(-1)
+            return
+        # The firmware wraps text from the end of a row onto the next row
+        for row in range(self.rows):
+            offset = self._row_offset(row)
+            if self.address == offset + self.columns - 1:
+                self.address = self._row_offset((row + 1) % self.rows)
+                return
+        self._move_cursor(1)
+
+    def _move_cursor(self, step):
+        """Move the cursor within its 40 character DDRAM line."""
+        line = self.address & 0x40
+        self.address = line | ((self.address - line + step) % 40)
+
+    def _special(self, command):
+        """Run a special command and return how long it takes."""
+        if command & _LCD_SETDDRAMADDR:
+            self.address = command & 0x7F
+        elif command & 0x40:
+            # CGRAM address, not used by the driver
+            pass
+        elif command & 0x20:
+            # function set, not used by the driver
+            pass
+        elif command & _LCD_CURSORSHIFT:
+            step = 1 if command & _LCD_MOVERIGHT else -1
+            if command & _LCD_DISPLAYMOVE:
+                self.shift -= step
+            else:
+                self._move_cursor(step)
+        elif command & _LCD_DISPLAYCONTROL:
+            self.display_control = command & 0x07
+        elif command & _LCD_ENTRYMODESET:
+            self.entry_mode = command & 0x03
+        elif command:
+            # clear or return home
+            if command == _LCD_CLEARDISPLAY:
+                self._clear()
+            self.address = 0
+            self.shift = 0
+            return self.clear_time
+        return self.command_time
+
+    def _clear(self):
+        """Blank the display and send the cursor home."""
+        self.ddram[:] = bytes((_BLANK_CELL,)) * len(self.ddram)
+        self.address = 0
+        self.shift = 0
+
+    def _setting(self, command, arguments):
+        """Run a setting command and return how long it takes."""
+        # pylint: disable=too-many-branches,too-many-return-statements
+        message = self.message_time if self.system_messages else 0
+        if command == _CLEAR_COMMAND:
+            self._clear()
+            return self.clear_time
+        if 0 <= command - _WRITE_CHARACTER_COMMAND < 8:
+            self._put(command - _WRITE_CHARACTER_COMMAND)
+            return self.char_time
+        if 0 <= command - _CREATE_CHARACTER_COMMAND < 8:
+            self.cgram[command - _CREATE_CHARACTER_COMMAND] = bytes(arguments)
+            return self.setting_time * 2
+        if command == _SET_RGB_COMMAND:
+            self.backlight = list(arguments)
+            return self.setting_time
+        if 128 <= command <= 217:
+            # one backlight color at a time, 0 to 29
+            color = (command - 128) // 30
+            self.backlight[color] = (command - 128 - color * 30) * 255 // 29
+            return self.setting_time + message
+        if command == _CONTRAST_COMMAND:
+            self.contrast = arguments[0]
+        elif command == _ADDRESS_COMMAND:
+            self.i2c_address = arguments[0]
+        elif 0 <= command - _BAUD_COMMAND < len(_BAUD_RATES):
+            self.display_baudrate = _BAUD_RATES[command - _BAUD_COMMAND]
+        elif command in (_WIDTH_20_COMMAND, _WIDTH_16_COMMAND):
+            self.columns = 20 if command == _WIDTH_20_COMMAND else 16
+        elif _LINES_4_COMMAND <= command <= _LINES_1_COMMAND:
+            self.rows = _ROW_COUNTS[_LINES_1_COMMAND - command]
+        elif command == _RESET_COMMAND:
+            self._clear()
+            return self.reset_time
+        elif command == _SPLASH_TOGGLE_COMMAND:
+            self.splash = not self.splash
+        elif command in (_ENABLE_SPLASH_DISPLAY, _DISABLE_SPLASH_DISPLAY):
+            self.splash = command == _ENABLE_SPLASH_DISPLAY
+        elif command == _SAVE_CURRENT_DISPLAY_AS_SPLASH:
+            self.splash_text = self.text
+        elif command == _IGNORE_RX_COMMAND:
+            self.ignore_rx = not self.ignore_rx
+        elif command in (
+            _ENABLE_SYSTEM_MESSAGE_DISPLAY,
+            _DISABLE_SYSTEM_MESSAGE_DISPLAY,
+        ):
+            self.system_messages = command == _ENABLE_SYSTEM_MESSAGE_DISPLAY
+            return self.setting_time
+        elif command == _SHOW_VERSION_COMMAND:
+            return self.message_time
+        else:
+            # unknown settings are ignored
+            return self.command_time
+        return self.setting_time + message
@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_graphics`
+================================================================================
+
+Big numbers and bar graphs for the Sparkfun Serial LCD displays
+
+
+* Author(s): Gaston Williams
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+# imports
+from micropython import const
+
+# private constants
+# Blank character
+_BLANK_CELL = const(0x20)
+
+# Full block character in the display character ROM
+_FULL_BLOCK = const(0xFF)
+
+# Custom characters for big numbers: a bar at the top, a bar at the bottom
+# and bars at both, used with the full block and a blank
+_BIG_GLYPHS = {
+    "U": (0x1F, 0x1F, 0x1F, 0x00, 0x00, 0x00, 0x00, 0x00),
+    "L": (0x00, 0x00, 0x00, 0x00, 0x00, 0x1F, 0x1F, 0x1F),
+    "B": (0x1F, 0x1F, 0x1F, 0x00, 0x00, 0x1F, 0x1F, 0x1F),
+}
+
+# Top and bottom rows of each big character, F is the full block
+_BIG_FONT = {
+    "0": ("FUF", "FLF"),
+    "1": ("UF ", "LFL"),
+    "2": ("BBF", "FLL"),
+    "3": ("BBF", "LLF"),
+    "4": ("FLF", "  F"),
+    "5": ("FBB", "LLF"),
+    "6": ("FBB", "FLF"),
+    "7": ("UUF", "  F"),
+    "8": ("FBF", "FLF"),
+    "9": ("FBF", "LLF"),
+    "-": ("LLL", "   "),
+    " ": ("   ", "   "),
+    ".": (" ", "L"),
+    ":": ("L", "U"),
+}
+
+# How each part of a 2 row character is drawn as two rows in 4 row characters
+_BIG_TALL = {"U": "U ", "L": " L", "B": "UL", "F": "FF", " ": "  "}
+
+
+class Sparkfun_SerLCD_BigNumber:
+    """Draw numbers 2 or 4 rows tall using custom characters.
+    lcd - Sparkfun_SerLCD driver object
+    height - 2 or 4 rows
+
+    Digits, "-", ".", ":" and blanks are drawn 3 columns wide with a blank
+    column between them.  The three custom characters used are loaded once
+    and kept loaded, and only the cells that change are sent.
+
+    big = Sparkfun_SerLCD_BigNumber(serlcd)
+    big.show("12.5")"""
+
+    def __init__(self, lcd, height=2):
+        if height not in (2, 4):
+            raise ValueError("Height must be 2 or 4")
+        self._lcd = lcd
+        self._height = height
+
+    def show(self, text, col=0, row=0):
+        """Draw text, usually a number, with its top left at col and row."""
+        # load the glyphs each time, which sends nothing when still loaded
+        slots = {" ": _BLANK_CELL, "F": _FULL_BLOCK}
+        for name, charmap in _BIG_GLYPHS.items():
+            slots[name] = self._lcd.load_character(charmap)
+
+        rows = [bytearray() for _ in range(self._height)]
+        for column in self._columns(str(text)):
+            for line, part in zip(rows, column):
+                line.append(slots[part])
+        self._lcd.write_cells(col, row, rows)
+
+    def _columns(self, text):
+        """Parts of each column of the big characters, top to bottom"""
+        for i, char in enumerate(text):
+            if i:
+                yield " " * self._height
+            top, bottom = _BIG_FONT.get(char, _BIG_FONT[" "])
+            for upper, lower in zip(top, bottom):
+                if self._height == 2:
+                    yield upper + lower
+                else:
+                    yield _BIG_TALL[upper] + _BIG_TALL[lower]
+
+
+class Sparkfun_SerLCD_BarGraph:
+    """Draw a horizontal or vertical bar graph using custom characters for
+    the partly filled cells.
+    lcd - Sparkfun_SerLCD driver object
+    col, row - position of the left end, or the bottom of a vertical bar
+    length - length of the bar in cells
+    vertical - True for a bar that grows upwards
+
+    A horizontal bar has 5 steps in each cell and uses 4 custom characters,
+    a vertical one has 8 steps in each cell and uses 7.  They are loaded
+    once and kept loaded, and only the cells that change are sent.
+
+    bar = Sparkfun_SerLCD_BarGraph(serlcd, 0, 1, 16)
+    bar.show(42, 100)"""
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, lcd, col, row, length, vertical=False):
+        self._lcd = lcd
+        self._col = col
+        self._row = row
+        self._length = length
+        self._vertical = vertical
+        self._steps = 8 if vertical else 5
+
+    def show(self, value, maximum=100):
+        """Draw the bar filled to value out of maximum."""
+        value = max(0, min(value, maximum))
+        filled = int(value * self._length * self._steps / maximum + 0.5)
+        cells = bytearray()
+        for i in range(self._length):
+            part = min(max(filled - i * self._steps, 0), self._steps)
+            if part == self._steps:
+                cells.append(_FULL_BLOCK)
+            elif part == 0:
+                cells.append(_BLANK_CELL)
+            else:
+                cells.append(self._lcd.load_character(self._glyph(part)))
+        if self._vertical:
+            # the bar grows up from its bottom row
+            rows = [cells[i : i + 1] for i in range(self._length - 1, -1, -1)]
+            self._lcd.write_cells(self._col, self._row - self._length + 1, rows)
+        else:
+            self._lcd.write_cells(self._col, self._row, [cells])
+
+    def _glyph(self, part):
+        """Bitmap for a cell filled part of the way"""
+        if self._vertical:
+            return bytes(8 - part) + bytes((0x1F,)) * part
+        return bytes(((0x1F << (5 - part)) & 0x1F,)) * 8
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_group`
+================================================================================
+
+Send to several Sparkfun Serial LCD displays at once
+
+
+* Author(s): Gaston Williams
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+# imports
+from time import sleep
+
+
+class _GroupMember:
+    """Queues method calls for one display in a Sparkfun_SerLCD_Group"""
+
+    def __init__(self, display, queue):
+        self._display = display
+        self._queue = queue
+
+    def __getattr__(self, name):
+        # raises AttributeError now for a name the display doesn't have,
+        # rather than when the queue is sent
+        value = getattr(self._display, name)
+        if not callable(value):
+            # properties such as ready are read from the display
+            return value
+
+        def method(*args, **kwargs):
+            self._queue.append((name, args, kwargs))
+
+        return method
+
+
+class Sparkfun_SerLCD_Group:
+    """Drive several Sparkfun Serial LCD displays that share a bus.
+    displays - list of Sparkfun_SerLCD driver objects
+
+    Calls made through group[index] are queued instead of run at once.
+    update() sends the queued calls for each display that is ready, as
+    one transfer per display, and moves on to the next display instead
+    of waiting while a display is busy.  The total time then depends on
+    the bus, rather than adding up the time each display needs.
+
+    group[0].clear()
+    group[1].set_cursor(0, 1)
+    group[1].write("Hello")
+    group.flush()"""
+
+    def __init__(self, displays):
+        self.displays = list(displays)
+        self._queues = [[] for _ in self.displays]
+        self._members = [
+            _GroupMember(lcd, queue) for lcd, queue in zip(self.displays, self._queues)
+        ]
+        self._next = 0
+
+    def __len__(self):
+        return len(self.displays)
+
+    def __getitem__(self, index):
+        return self._members[index]
+
+    @property
+    def pending(self):
+        """True while there are queued calls that have not been sent."""
+        return any(self._queues)
+
+    def update(self):
+        """Send the queued calls for every display that is ready, without
+        waiting for the busy ones.  Returns True if calls are still queued."""
+        count = len(self.displays)
+        if not count:
+            return False
+        for i in range(count):
+            index = (self._next + i) % count
+            queue = self._queues[index]
+            lcd = self.displays[index]
+            if queue and lcd.ready:
+                # take the calls off the queue first, so a call that raises
+                # doesn't leave the ones already sent to be sent again
+                calls = queue[:]
+                del queue[:]
+                with lcd.batch():
+                    for name, args, kwargs in calls:
+                        getattr(lcd, name)(*args, **kwargs)
+        # start with the next display on the next update for fairness
+        self._next = (self._next + 1) % count
+        return self.pending
+
+    def flush(self):
+        """Send all the queued calls, waiting only when every display with
+        queued calls is busy."""
+        while self.update():
+            delay = min(
+                lcd.wait_time
+                for lcd, queue in zip(self.displays, self._queues)
+                if queue
+            )
+            if delay > 0:
+                sleep(delay)
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_recorder`
+================================================================================
+
+Recorded command sequences for the Sparkfun Serial LCD displays
+
+
+* Author(s): Gaston Williams
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+# imports
+from micropython import const
+from sparkfun_serlcd import Sparkfun_SerLCD
+
+# private constants
+_MAX_ROWS = const(4)
+_MAX_COLS = const(20)
+
+_SEQUENCE_MAGIC = b"SLCD"
+
+
+class Sparkfun_SerLCD_Sequence:
+    """Display commands recorded by Sparkfun_SerLCD_Recorder, ready to be
+    sent with Sparkfun_SerLCD.play().
+    data - bytes to send to the display
+    settle - seconds the display needs after the bytes are sent"""
+
+    def __init__(self, data, settle):
+        self._data = bytes(data)
+        self._settle = settle
+
+    @property
+    def data(self):
+        """Bytes to send to the display"""
+        return self._data
+
+    @property
+    def settle(self):
+        """Seconds the display needs after the bytes are sent"""
+        return self._settle
+
+    def save(self, path):
+        """Write the sequence to a file."""
+        with open(path, "wb") as file:
+            file.write(_SEQUENCE_MAGIC)
+            file.write(int(self._settle * 1000000).to_bytes(4, "big"))
+            file.write(self._data)
+
+    @classmethod
+    def load(cls, path):
+        """Read a sequence from a file written by save()."""
+        with open(path, "rb") as file:
+            blob = file.read()
+        if blob[:4] != _SEQUENCE_MAGIC:
+            raise ValueError("Not a SerLCD sequence file")
+        return cls(blob[8:], int.from_bytes(blob[4:8], "big") / 1000000)
+
+
+class Sparkfun_SerLCD_Recorder(Sparkfun_SerLCD):
+    """Record display commands into a Sparkfun_SerLCD_Sequence instead of
+    sending them, so a fixed screen can be sent again later as a single
+    write without working out each command again.
+
+    recorder = Sparkfun_SerLCD_Recorder()
+    recorder.clear()
+    recorder.write("Main Menu")
+    menu = recorder.compile()
+    serlcd.play(menu)"""
+
+    def __init__(self, rows=_MAX_ROWS, columns=_MAX_COLS):
+        self._data = bytearray()
+        self._total_settle = 0
+        super().__init__(rows, columns)
+        # Nothing is known about the display the sequence is played on
+        self._forget_state()
+
+    def compile(self):
+        """Return the commands recorded so far as a sequence."""
+        return Sparkfun_SerLCD_Sequence(self._data, self._total_settle)
+
+    def restart(self):
+        """Throw away the commands recorded so far."""
+        del self._data[:]
+        self._total_settle = 0
+        self._forget_state()
+
+    def _begin(self):
+        pass
+
+    def _send(self, data):
+        self._data.extend(data)
+
+    def _transfer(self, data):
+        self._data.extend(data)
+
+    def _settle(self, delay):
+        self._total_settle += delay
+
+    def _wait_ready(self):
+        pass
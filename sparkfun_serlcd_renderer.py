@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_renderer`
+================================================================================
+
+Frame rate limited rendering for the Sparkfun Serial LCD displays
+
+
+* Author(s): Gaston Williams
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+# imports
+from sparkfun_serlcd_transport import monotonic_ns, next_frame_time, sleep_until
+
+
+class Sparkfun_SerLCD_Renderer:
+    """Send frames to a Sparkfun Serial LCD display at no more than a
+    given frame rate, always sending the newest one.
+    lcd - Sparkfun_SerLCD driver object
+    fps - most frames sent each second
+
+    Frames are lists of lines, as for write_frame(), and can be submitted
+    at any rate.  A frame that is replaced before it is sent is dropped
+    and counted in dropped.  Call update() from the main loop, or start()
+    a background thread to send frames, which needs threading.
+
+    renderer = Sparkfun_SerLCD_Renderer(serlcd, fps=10)
+    while True:
+        renderer.submit(["Count:", str(count)])
+        renderer.update()"""
+
+    def __init__(self, lcd, fps=10):
+        self._lcd = lcd
+        self.fps = fps
+        self._frame = None
+        self._next_frame = 0
+        self._thread = None
+        self._running = False
+        try:
+            # pylint: disable=import-outside-toplevel
+            from threading import Condition
+
+            self._condition = Condition()
+        except ImportError:
+            self._condition = None
+        self.sent = 0
+        self.dropped = 0
+        self.error = None
+
+    @property
+    def pending(self):
+        """True while a frame is waiting to be sent."""
+        return self._frame is not None
+
+    def submit(self, lines):
+        """Set the next frame to send, replacing one not yet sent."""
+        frame = tuple(lines)
+        if self._condition is None:
+            self._replace(frame)
+            return
+        with self._condition:
+            self._replace(frame)
+            self._condition.notify_all()
+
+    def update(self):
+        """Send the newest frame if one is waiting, the frame rate allows
+        and the display is ready.  Returns True if a frame was sent."""
+        now = monotonic_ns()
+        if self._frame is None or now < self._next_frame or not self._lcd.ready:
+            return False
+        if self._condition is None:
+            frame, self._frame = self._frame, None
+        else:
+            with self._condition:
+                frame, self._frame = self._frame, None
+        self._next_frame = next_frame_time(self._next_frame, now, self.fps)
+        self._lcd.write_frame(frame)
+        self.sent += 1
+        return True
+
+    def start(self):
+        """Send frames from a background thread until stop() is called."""
+        if self._condition is None:
+            raise RuntimeError("Sparkfun_SerLCD_Renderer.start requires threading")
+        if self._thread is None:
+            # pylint: disable=import-outside-toplevel
+            from threading import Thread
+
+            self._running = True
+            self._thread = Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread.  A waiting frame is kept."""
+        if self._thread is None:
+            return
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join()
+        self._thread = None
+
+    def _replace(self, frame):
+        """Make frame the next one to send, dropping any waiting frame"""
+        if self._frame is not None:
+            self.dropped += 1
+        self._frame = frame
+
+    def _run(self):
+        """Send frames until stopped."""
+        while True:
+            with self._condition:
+                while self._running and self._frame is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+            # wait for the frame rate and the display outside the lock
+            sleep_until(self._next_frame)
+            try:
+                self._lcd.wait()
+                self.update()
+            except Exception as error:  # pylint: disable=broad-except
+                # the frame is lost, but later frames still go out;
+                # the caller finds the failure in error
+                self.error = error
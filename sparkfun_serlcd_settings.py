@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_settings`
+================================================================================
+
+Persistent settings for the Sparkfun Serial LCD displays
+
+
+* Author(s): Gaston Williams
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+
+class Sparkfun_SerLCD_Settings:
+    """Remember the settings a Sparkfun Serial LCD display keeps in its
+    EEPROM across restarts, so they are only sent when they change.
+    lcd - Sparkfun_SerLCD driver object
+    store - path of a json file, or a bytearray-like memory such as
+    microcontroller.nvm
+    key - name the display is saved under, so one store can hold several
+
+    Each setting sent to the display is slow and wears its EEPROM.  After
+    load(), setting the backlight, contrast, splash screen, system messages
+    or I2C address to the saved value sends nothing.  save() writes the
+    store only when the settings have changed.  Changes made to the
+    display some other way are not seen.
+
+    settings = Sparkfun_SerLCD_Settings(serlcd, "/serlcd.json")
+    settings.load()
+    serlcd.set_contrast(40)
+    serlcd.set_backlight(0xFF8C00)
+    settings.save()"""
+
+    def __init__(self, lcd, store, key="serlcd"):
+        self._lcd = lcd
+        self._store = store
+        self._key = key
+        self._saved = None
+
+    def load(self):
+        """Read the saved settings of the display.  Returns True if there
+        were any."""
+        saved = self._read().get(self._key)
+        if not saved:
+            return False
+        self._lcd.assume_settings(saved)
+        self._saved = saved
+        return True
+
+    def save(self):
+        """Save the settings of the display if they have changed."""
+        settings = self._lcd.settings
+        if settings == self._saved:
+            return
+        stored = self._read()
+        stored[self._key] = settings
+        self._write(stored)
+        self._saved = settings
+
+    def _read(self):
+        """Everything in the store, or nothing if it is empty or unreadable"""
+        import json  # pylint: disable=import-outside-toplevel
+
+        try:
+            if isinstance(self._store, str):
+                with open(self._store, "rb") as file:
+                    data = file.read()
+            else:
+                # memory starts with the length of the json text
+                size = (self._store[0] << 8) | self._store[1]
+                if size > len(self._store) - 2:
+                    return {}
+                data = bytes(self._store[2 : 2 + size])
+            return json.loads(data.decode())
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, stored):
+        """Replace everything in the store"""
+        import json  # pylint: disable=import-outside-toplevel
+
+        data = json.dumps(stored).encode()
+        if isinstance(self._store, str):
+            with open(self._store, "wb") as file:
+                file.write(data)
+            return
+        if len(data) > len(self._store) - 2:
+            raise ValueError("Settings do not fit in the store")
+        self._store[2 : 2 + len(data)] = data
+        self._store[0:2] = bytes((len(data) >> 8, len(data) & 0xFF))
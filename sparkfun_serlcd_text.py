@@ -0,0 +1,432 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_text`
+================================================================================
+
+Text encoding and frame updates for the Sparkfun Serial LCD displays,
+shared by the drivers in sparkfun_serlcd
+
+
+* Author(s): Gaston Williams
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+# imports
+from micropython import const
+from sparkfun_serlcd_transport import Sparkfun_SerLCD_Transport
+
+# public constants
+ALIGN_LEFT = const(0)
+"""Align text with the left edge of a row"""
+ALIGN_CENTER = const(1)
+"""Center text in a row"""
+ALIGN_RIGHT = const(2)
+"""Align text with the right edge of a row"""
+
+# private constants
+# Display sizes the OpenLCD firmware supports
+_ROW_COUNTS = (1, 2, 4)
+_COLUMN_COUNTS = (16, 20)
+
+# Shadow framebuffer cell values
+_BLANK_CELL = const(0x20)
+# 254 always starts a special command, so it can never be shown on the display
+_UNKNOWN_CELL = const(0xFE)
+
+# Unchanged cells between two changed runs that are cheaper to resend
+# than to reposition the cursor with another DDRAM address command
+_MAX_RUN_GAP = const(2)
+
+# OpenLCD command characters
+_SPECIAL_COMMAND = const(254)
+_SETTING_COMMAND = const(0x7C)
+# 35-42, command to write custom characters 0 to 7
+_WRITE_CHARACTER_COMMAND = const(35)
+
+# special commands and flags for display entry mode
+_LCD_RETURNHOME = const(0x02)
+_LCD_ENTRYMODESET = const(0x04)
+_LCD_SETDDRAMADDR = const(0x80)
+_LCD_ENTRYLEFT = const(0x02)
+_LCD_ENTRYSHIFTINCREMENT = const(0x01)
+_LCD_ENTRYSHIFTDECREMENT = const(0x00)
+
+# Entry mode command for plain left to right text without autoscroll
+_LEFT_TO_RIGHT = bytes((_SPECIAL_COMMAND, _LCD_ENTRYMODESET | _LCD_ENTRYLEFT))
+
+
+# Display character ROM (HD44780 A00) codes for characters outside ASCII
+_ROM_CODES = {
+    0x00A2: 0xEC,  # cent sign
+    0x00A3: 0xED,  # pound sign
+    0x00A5: 0x5C,  # yen sign
+    0x00B0: 0xDF,  # degree sign
+    0x00B5: 0xE4,  # micro sign
+    0x00B7: 0xA5,  # middle dot
+    0x00DF: 0xE2,  # sharp s
+    0x00E4: 0xE1,  # a with diaeresis
+    0x00F1: 0xEE,  # n with tilde
+    0x00F6: 0xEF,  # o with diaeresis
+    0x00F7: 0xFD,  # division sign
+    0x00FC: 0xF5,  # u with diaeresis
+    0x03A3: 0xF6,  # capital sigma
+    0x03A9: 0xF4,  # capital omega
+    0x03B1: 0xE0,  # alpha
+    0x03B2: 0xE2,  # beta
+    0x03B5: 0xE3,  # epsilon
+    0x03B8: 0xF2,  # theta
+    0x03BC: 0xE4,  # mu
+    0x03C0: 0xF7,  # pi
+    0x03C1: 0xE6,  # rho
+    0x03C3: 0xE5,  # sigma
+    0x2126: 0xF4,  # ohm sign
+    0x2190: 0x7F,  # left arrow
+    0x2192: 0x7E,  # right arrow
+    0x221A: 0xE8,  # square root
+    0x221E: 0xF3,  # infinity
+    0x2588: 0xFF,  # full block
+}
+# Katakana are 0xA1 to 0xDF, in the order of the halfwidth forms
+_ROM_CODES.update((0xFF61 - 0xA1 + code, code) for code in range(0xA1, 0xE0))
+_ROM_CODES.update(
+    (ord(char), code)
+    for code, char in enumerate(
+        "\u3002\u300c\u300d\u3001\u30fb\u30f2\u30a1\u30a3\u30a5\u30a7\u30a9"
+        "\u30e3\u30e5\u30e7\u30c3\u30fc\u30a2\u30a4\u30a6\u30a8\u30aa\u30ab"
+        "\u30ad\u30af\u30b1\u30b3\u30b5\u30b7\u30b9\u30bb\u30bd\u30bf\u30c1"
+        "\u30c4\u30c6\u30c8\u30ca\u30cb\u30cc\u30cd\u30ce\u30cf\u30d2\u30d5"
+        "\u30d8\u30db\u30de\u30df\u30e0\u30e1\u30e2\u30e4\u30e6\u30e8\u30e9"
+        "\u30ea\u30eb\u30ec\u30ed\u30ef\u30f3\u309b\u309c",
+        0xA1,
+    )
+)
+
+
+def _ascii_code(code, substitute):
+    """The code itself if it is shown as that ASCII character, or the
+    substitute for control codes and the setting command character"""
+    if 0x20 <= code < 0x80 and code != _SETTING_COMMAND:
+        return code
+    return substitute
+
+
+class _RomTable(dict):
+    """str.translate() table from Unicode to the display character ROM,
+    adding each character not in _ROM_CODES when it is first seen"""
+
+    def __init__(self, substitute):
+        super().__init__((key, chr(code)) for key, code in _ROM_CODES.items())
+        self._substitute = substitute
+
+    def __missing__(self, key):
+        char = chr(_ascii_code(key, self._substitute))
+        self[key] = char
+        return char
+
+
+# base class for text on the display
+class Sparkfun_SerLCD_Text(Sparkfun_SerLCD_Transport):
+    """Base class of Sparkfun_SerLCD that writes text to the display.
+    Text is encoded in the display character ROM, and a shadow framebuffer
+    keeps what is on the display, so a frame only sends the cells that
+    changed."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, rows, columns):
+        super().__init__()
+        # Entry mode flags, and whether they are known to be on the display
+        self._display_mode = _LCD_ENTRYLEFT | _LCD_ENTRYSHIFTDECREMENT
+        self._mode_known = False
+        # Host-side copy of every cell on the display and the cursor position
+        # as an index into it, or None when the cursor position is not known
+        self._cursor_pos = None
+        self._resize(rows, columns)
+        # Whether the display may be scrolled away from its first position
+        self._shifted = True
+        self._frame_data = bytearray()
+        # Code shown for characters not in the character ROM, and the table
+        # used to translate text, made when first needed
+        self._substitute = ord("?")
+        self._rom_table = None
+
+    @property
+    def rows(self):
+        """Number of rows on the display"""
+        return self._rows
+
+    @property
+    def columns(self):
+        """Number of characters in each row of the display"""
+        return self._cols
+
+    def write(self, message):
+        """Write a character string to the display."""
+        # Value -> String -> Bytes in the display character ROM
+        self.write_bytes(self.encode(message))
+
+    def set_substitute(self, char):
+        """Set the character shown in place of characters that are not in
+        the display character ROM, control characters and '|', which
+        starts a setting command.  The default is '?'.
+        char - a character, or a character ROM code"""
+        if isinstance(char, str):
+            char = _ROM_CODES.get(ord(char), ord(char))
+        if not 0x20 <= char <= 0xFF or char in (_SETTING_COMMAND, _SPECIAL_COMMAND):
+            raise ValueError("Substitute must be a printable character")
+        self._substitute = char
+        self._rom_table = None
+
+    def write_bytes(self, data):
+        """Write characters to the display directly from a bytes, bytearray
+        or memoryview object, without encoding or copying them."""
+        self._track_text(data)
+        self._send(data)
+
+    def write_frame(self, lines):
+        """Update the display to show a full screen of text.
+        lines - list of strings, one per row, or a single string with the
+        rows separated by newlines.  Rows are padded with blanks to the
+        width of the display, and missing rows are blank.
+
+        Only the runs of cells that differ from what is already on the
+        display are sent, each as a positioned write, so there is no need
+        to clear the display before each new frame."""
+        if isinstance(lines, str):
+            lines = lines.split("\n")
+
+        data = self._start_frame()
+        for row in range(self._rows):
+            text = lines[row] if row < len(lines) else b""
+            self._diff_row(data, row, 0, self._fill_row(text))
+        self._send_frame(data)
+
+    def assume_frame(self, lines):
+        """Tell the driver the display already shows a full screen of text,
+        such as the last frame written before a restart with attach=True,
+        so the next frames only send what differs from it.  Nothing is
+        sent to the display.
+        lines - list of strings, one per row, as for write_frame()"""
+        if isinstance(lines, str):
+            lines = lines.split("\n")
+
+        for row in range(self._rows):
+            text = lines[row] if row < len(lines) else b""
+            start = row * self._cols
+            self._shadow[start : start + self._cols] = self._fill_row(text)
+
+    def write_lines(self, lines, align=ALIGN_LEFT):
+        """Write rows of text to the display, starting with the top row.
+        lines - list of strings, one per row
+        align - ALIGN_LEFT, ALIGN_CENTER or ALIGN_RIGHT
+
+        Each row is padded with blanks or truncated to the width of the
+        display, so text left over from longer lines is erased without a
+        clear().  Rows after the last line are left as they are.  All the
+        rows are sent in one transfer, skipping cells that already show
+        the right character."""
+        data = self._start_frame()
+        for row in range(min(len(lines), self._rows)):
+            self._diff_row(data, row, 0, self._fill_row(lines[row], align))
+        self._send_frame(data)
+
+    def write_row(self, row, text, align=ALIGN_LEFT):
+        """Write a row of text, padded with blanks or truncated to the width
+        of the display, in one transfer.
+        row - row number, starting with 0 at the top
+        align - ALIGN_LEFT, ALIGN_CENTER or ALIGN_RIGHT"""
+        # keep row in bounds like set_cursor()
+        row = min(max(0, row), self._rows - 1)
+        data = self._start_frame()
+        self._diff_row(data, row, 0, self._fill_row(text, align))
+        self._send_frame(data)
+
+    def encode(self, text):
+        """Return text as bytes in the display character ROM, the way
+        write() sends it."""
+        text = str(text)
+        data = text.encode()
+        # Only ASCII text encodes to one byte per character, and it is sent
+        # as is unless it has control codes or the setting command character
+        if len(data) == len(text) and _SETTING_COMMAND not in data:
+            if not data or min(data) >= 0x20:
+                return data
+        if hasattr(text, "translate"):
+            if self._rom_table is None:
+                self._rom_table = _RomTable(self._substitute)
+            # every character is now below 256, one byte each in latin-1
+            return text.translate(self._rom_table).encode("latin-1")
+        # ports without str.translate
+        return bytes(
+            _ROM_CODES.get(code, _ascii_code(code, self._substitute))
+            for code in map(ord, text)
+        )
+
+    def write_cells(self, col, row, rows):
+        """Write rows of cell values to a block of the display starting at
+        col and row, sending only the cells that changed in one transfer.
+        rows - list of bytes in the display character ROM, one per row,
+        where values 0 to 7 are custom characters.  Cells past the edges
+        of the display are left out."""
+        data = self._start_frame()
+        for i, cells in enumerate(rows):
+            if not 0 <= row + i < self._rows:
+                continue
+            width = min(len(cells), self._cols - col)
+            if width > 0:
+                self._diff_row(data, row + i, col, cells[:width])
+        self._send_frame(data)
+
+    def write_ddram(self, row, address, data):
+        """Write bytes in the display character ROM to the display memory
+        of a row, starting at address 0 to 39, without undoing scrolling or
+        comparing them with what is on the display.  Addresses at and past
+        the width of the display are out of view until the display is
+        scrolled, so this loads text for scroll_display_left() to bring
+        into view.  The text on the display is no longer known afterwards,
+        so the next frame is sent in full."""
+        frame = self._frame_data
+        del frame[:]
+        frame.append(_SPECIAL_COMMAND)
+        frame.append(_LCD_SETDDRAMADDR | (self._row_offsets[row] + address))
+        frame.extend(data)
+        self._send_frame(frame)
+        self._invalidate_shadow()
+
+    # private functions
+
+    def _resize(self, rows, columns):
+        """Size the shadow framebuffer and row buffer for the display."""
+        if rows not in _ROW_COUNTS or columns not in _COLUMN_COUNTS:
+            raise ValueError("Unsupported display size")
+        self._rows = rows
+        self._cols = columns
+        # DDRAM address for the start of each row
+        self._row_offsets = (0x00, 0x40, columns, 0x40 + columns)[:rows]
+        self._shadow = bytearray(rows * columns)
+        self._row_cells = bytearray(columns)
+        self._invalidate_shadow()
+
+    def _clear_shadow(self):
+        """Mark every cell blank and the cursor home, as after a clear."""
+        self._shadow[:] = bytes((_BLANK_CELL,)) * len(self._shadow)
+        self._cursor_pos = 0
+        self._shifted = False
+
+    def _invalidate_shadow(self):
+        """Forget the display contents and cursor position, so the next
+        frame is sent in full."""
+        self._shadow[:] = bytes((_UNKNOWN_CELL,)) * len(self._shadow)
+        self._cursor_pos = None
+
+    def _fill_row(self, text, align=ALIGN_LEFT):
+        """Copy text into the row buffer, truncated or padded with blanks
+        to the width of the display."""
+        if not isinstance(text, (bytes, bytearray, memoryview)):
+            text = self.encode(text)
+        cells = self._row_cells
+        count = min(len(text), self._cols)
+        if align == ALIGN_RIGHT:
+            start = self._cols - count
+        elif align == ALIGN_CENTER:
+            start = (self._cols - count) // 2
+        else:
+            start = 0
+        for i in range(start):
+            cells[i] = _BLANK_CELL
+        cells[start : start + count] = memoryview(text)[:count]
+        for i in range(start + count, self._cols):
+            cells[i] = _BLANK_CELL
+        return cells
+
+    def _start_frame(self):
+        """Empty the frame buffer for _diff_row() and start it by undoing
+        any scrolling, so cells are shown at their own positions."""
+        data = self._frame_data
+        del data[:]
+        if self._shifted:
+            data.append(_SPECIAL_COMMAND)
+            data.append(_LCD_RETURNHOME)
+            self._cursor_pos = 0
+            self._shifted = False
+        return data
+
+    def _send_frame(self, data):
+        """Send positioned writes built by _diff_row()."""
+        if not data:
+            return
+        # Positioned writes only land in the right cells when written left
+        # to right without autoscroll, so switch to that for the frame
+        if not self._mode_known or self._display_mode != _LCD_ENTRYLEFT:
+            data[0:0] = _LEFT_TO_RIGHT
+            if self._mode_known:
+                data.append(_SPECIAL_COMMAND)
+                data.append(_LCD_ENTRYMODESET | self._display_mode)
+            else:
+                self._display_mode = _LCD_ENTRYLEFT
+                self._mode_known = True
+        self._send(data)
+        # The positioned writes are special commands
+        self._settle(0.050)
+
+    def _track_text(self, text):
+        """Update the shadow framebuffer with characters written at the cursor."""
+        pos = self._cursor_pos
+        mode = self._display_mode if self._mode_known else None
+        # Autoscroll moves the display along with the text
+        if mode is None or mode & _LCD_ENTRYSHIFTINCREMENT:
+            self._shifted = True
+        # Only plain left to right text can be followed
+        if pos is None or mode != _LCD_ENTRYLEFT:
+            self._invalidate_shadow()
+            return
+
+        # Text wraps from the end of each row onto the next row
+        size = len(self._shadow)
+        for char in text:
+            self._shadow[pos] = char
+            pos = (pos + 1) % size
+        self._cursor_pos = pos
+
+    def _diff_row(self, data, row, col, cells):
+        """Append the commands that change the cells in a row, starting at
+        column col, to the bytes in data and update the shadow framebuffer."""
+        start = row * self._cols + col
+        shadow = self._shadow
+        end = len(cells)
+        i = 0
+        while i < end:
+            # skip over cells that are already on the display
+            if shadow[start + i] == cells[i]:
+                i += 1
+                continue
+            # extend the run while cells change or the gap is short
+            run_end = i + 1
+            j = run_end
+            while j < end and j - run_end <= _MAX_RUN_GAP:
+                if shadow[start + j] != cells[j]:
+                    run_end = j + 1
+                j += 1
+
+            if self._cursor_pos != start + i:
+                data.append(_SPECIAL_COMMAND)
+                data.append(_LCD_SETDDRAMADDR | (col + i + self._row_offsets[row]))
+            for k in range(i, run_end):
+                char = cells[k]
+                if char < 8:
+                    # custom characters are written with a setting command
+                    data.append(_SETTING_COMMAND)
+                    data.append(_WRITE_CHARACTER_COMMAND + char)
+                else:
+                    data.append(char)
+                shadow[start + k] = char
+            # Don't count on where the cursor goes past the end of a row
+            if col + run_end < self._cols:
+                self._cursor_pos = start + run_end
+            else:
+                self._cursor_pos = None
+            i = run_end
@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_ticker`
+================================================================================
+
+Scrolling text for the Sparkfun Serial LCD displays
+
+
+* Author(s): Gaston Williams
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+# imports
+from micropython import const
+from sparkfun_serlcd_transport import monotonic_ns
+
+# private constants
+# Characters in each DDRAM line, shared by two rows on a 4 row display
+_DDRAM_LINE_LENGTH = const(40)
+
+
+class Sparkfun_SerLCD_Ticker:
+    """Scroll text that is longer than the display, like a news ticker.
+    lcd - Sparkfun_SerLCD driver object
+    lines - list of strings, one per row starting with the top row
+    speed - characters a second to scroll
+    gap - text put between the end of a line and its next start
+
+    When the ticker has a line for every row of a display with one or two
+    rows, the whole 40 character DDRAM line of each row is loaded, and the
+    text is scrolled by the display itself.  Only the characters about to
+    come into view are rewritten, and only when they change.  Otherwise
+    each line longer than the display is rewritten in place at each step,
+    sending only the characters that changed.
+
+    ticker = Sparkfun_SerLCD_Ticker(serlcd, ["A long status message"])
+    while True:
+        ticker.update()"""
+
+    def __init__(self, lcd, lines, speed=10, gap="   "):
+        self._lcd = lcd
+        self.speed = speed
+        self._gap = gap
+        self._lines = []
+        self._offset = 0
+        self._filled = 0
+        self._ddram = []
+        self._hardware = False
+        self._next_step = 0
+        self.set_lines(lines)
+
+    def set_lines(self, lines):
+        """Change the text and start scrolling from the beginning."""
+        lcd = self._lcd
+        rows = min(len(lines), lcd.rows)
+        self._lines = [lcd.encode(line) for line in lines[:rows]]
+        self._hardware = lcd.rows <= 2 and rows == lcd.rows
+        self._offset = 0
+        with lcd.batch():
+            if self._hardware:
+                # undo any earlier scrolling and load each DDRAM line
+                lcd.home()
+                self._ddram = [bytearray(_DDRAM_LINE_LENGTH) for _ in self._lines]
+                self._filled = -1
+                self._fill(_DDRAM_LINE_LENGTH - 1)
+            else:
+                for row, line in enumerate(self._lines):
+                    lcd.write_row(row, line)
+        self._next_step = monotonic_ns()
+
+    def update(self):
+        """Scroll one step if it is time to, and return True if it did.
+        Call this often, for example from the main loop."""
+        now = monotonic_ns()
+        if now < self._next_step or not self.speed:
+            return False
+        self._next_step = max(self._next_step, now - 1000000000) + int(
+            1000000000 / self.speed
+        )
+        self.step()
+        return True
+
+    def step(self):
+        """Scroll the text one character to the left."""
+        lcd = self._lcd
+        self._offset += 1
+        with lcd.batch():
+            if self._hardware:
+                # load what is about to come into view before the shift
+                last = self._offset + lcd.columns - 1
+                if self._filled < last:
+                    self._fill(self._offset + _DDRAM_LINE_LENGTH - 2)
+                lcd.scroll_display_left()
+            else:
+                for row, line in enumerate(self._lines):
+                    if len(line) > lcd.columns:
+                        lcd.write_row(row, self._window(line))
+
+    def stop(self):
+        """Stop scrolling and return the display to its first position."""
+        self._lcd.home()
+
+    def _text(self, line):
+        """A line with the gap added, for scrolling around"""
+        if len(line) > self._lcd.columns or self._hardware:
+            return line + self._lcd.encode(self._gap)
+        return line
+
+    def _window(self, line):
+        """The part of a line that is in view at the current offset"""
+        columns = self._lcd.columns
+        text = self._text(line)
+        start = self._offset % len(text)
+        window = text[start : start + columns]
+        if len(window) < columns:
+            window += text[: columns - len(window)]
+        return window
+
+    def _fill(self, last):
+        """Load the DDRAM of each row, from the first position not yet
+        loaded up to position last, counted from the start of the text."""
+        lcd = self._lcd
+        for row, line in enumerate(self._lines):
+            text = self._text(line) or b" "
+            ddram = self._ddram[row]
+            run = bytearray()
+            start = None
+            for position in range(self._filled + 1, last + 1):
+                char = text[position % len(text)]
+                cell = position % _DDRAM_LINE_LENGTH
+                if ddram[cell] == char:
+                    continue
+                # start a new positioned write where the display would
+                # not move on to the next cell by itself
+                if start is None or start + len(run) != cell or cell == lcd.columns:
+                    if run:
+                        lcd.write_ddram(row, start, run)
+                    run = bytearray()
+                    start = cell
+                run.append(char)
+                ddram[cell] = char
+            if run:
+                lcd.write_ddram(row, start, run)
+        self._filled = last
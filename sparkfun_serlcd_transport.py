@@ -0,0 +1,406 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_transport`
+================================================================================
+
+Batching, pacing and bus locking of the writes to the Sparkfun Serial LCD
+displays, shared by the drivers in sparkfun_serlcd
+
+
+* Author(s): Gaston Williams
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+# imports
+from time import sleep
+from micropython import const
+
+try:
+    from time import monotonic_ns
+except ImportError:
+    from time import monotonic
+
+    def monotonic_ns():
+        """Fallback for ports without time.monotonic_ns()"""
+        return int(monotonic() * 1000000000)
+
+
+# private constants
+# Flow control defaults: the OpenLCD receive buffer size and about how
+# many characters a second the display can process
+_RX_BUFFER_SIZE = const(64)
+_BYTE_RATE = const(10000)
+
+
+def next_frame_time(due, now, fps):
+    """Return the monotonic_ns() time the frame after one due at due is
+    due, at fps frames a second.  Frames missed while the caller was busy
+    are skipped rather than sent late in a burst."""
+    return max(due + int(1000000000 / fps), now)
+
+
+def sleep_until(due):
+    """Sleep until the monotonic_ns() time due, if it has not passed."""
+    remaining = due - monotonic_ns()
+    if remaining > 0:
+        sleep(remaining / 1000000000)
+
+
+# private functions
+
+
+def _release(view):
+    """Let go of a memoryview, so the buffer under it can be resized again.
+    Ports without memoryview.release() don't lock the buffer."""
+    if hasattr(view, "release"):
+        view.release()
+
+
+class _Batch:
+    """Context manager returned by Sparkfun_SerLCD.batch()"""
+
+    def __init__(self, lcd):
+        self._lcd = lcd
+
+    def __enter__(self):
+        self._lcd._batch_depth += 1  # pylint: disable=protected-access
+        return self._lcd
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        lcd = self._lcd
+        # pylint: disable=protected-access
+        lcd._batch_depth -= 1
+        if lcd._batch_depth == 0:
+            lcd._flush()
+
+
+class _Session:
+    """Context manager returned by Sparkfun_SerLCD.session()"""
+
+    def __init__(self, lcd):
+        self._lcd = lcd
+        self._depth = 0
+        self._bus = None
+        # The entered bus device while the bus is held, and the bytes
+        # written since it was taken
+        self.device = None
+        self.held_bytes = 0
+
+    def __enter__(self):
+        if self._depth == 0:
+            self.acquire()
+        self._depth += 1
+        return self._lcd
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._depth -= 1
+        if self._depth == 0:
+            self.release()
+
+    def acquire(self):
+        """Take the bus lock, if the display is on a shared bus."""
+        # pylint: disable=protected-access
+        self._bus = self._lcd._bus_device()
+        if self._bus is not None:
+            # held open across calls, so it can't be a with statement
+            # pylint: disable=unnecessary-dunder-call
+            self.device = self._bus.__enter__()
+        self.held_bytes = 0
+
+    def release(self):
+        """Let the bus lock go."""
+        if self.device is not None:
+            self.device = None
+            self._bus.__exit__(None, None, None)
+
+
+# base class for writing to the display
+class Sparkfun_SerLCD_Transport:
+    """Base class of Sparkfun_SerLCD that sends bytes to the display.
+    Bytes are collected into batches, split into chunks that fit the
+    receive buffer of the display and sent no sooner than the display can
+    take them.  Subclasses write each chunk with _write_bytes()."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    # Largest transfer the display can take at once
+    _chunk_size = _RX_BUFFER_SIZE
+
+    def __init__(self):
+        # Commands collected by batch() and the longest wait they need
+        self._batch = _Batch(self)
+        self._batch_depth = 0
+        self._pending = bytearray()
+        self._pending_settle = 0
+        # Bus lock held by session() and the most bytes written under it
+        self._session = _Session(self)
+        self._max_hold = 0
+        # Time in nanoseconds when the display can take the next command
+        self._busy_until = 0
+        # Counters for each public method, None unless instrumented
+        self._stats = None
+        self._stats_method = None
+        self._on_transfer = None
+        # Characters a second the display is sent at most
+        self._byte_rate = _BYTE_RATE
+
+    def batch(self):
+        """Collect display commands into a single transfer.
+        Use as a context manager.  Inside the block, commands and text are
+        added to a pending buffer instead of being sent one at a time with
+        a wait after each one.  On exit, the buffer is sent in one write,
+        and the display is given time for the slowest command in it
+        before anything else is sent.
+
+        with serlcd.batch():
+            serlcd.set_cursor(0, 0)
+            serlcd.write("Hello")
+            serlcd.set_fast_backlight(0x00FF00)"""
+        return self._batch
+
+    def session(self):
+        """Hold the bus lock across a burst of display writes.
+        Use as a context manager.  Without it, the lock on a shared I2C or
+        SPI bus is taken and let go for every write.  Inside the block it
+        is taken once, so other devices on the bus wait until the block
+        ends, or until set_lock_policy() lets them have a turn.  The lock
+        is let go while waiting for the display.  Does nothing over UART.
+
+        with serlcd.session(), serlcd.batch():
+            serlcd.write_frame(["Temp: 21.5", "Humidity: 40%"])"""
+        return self._session
+
+    def set_lock_policy(self, max_hold=0):
+        """Set how long session() holds the bus lock.
+        max_hold - most bytes written under the lock before letting it go
+        for a moment, so other devices on the bus get a turn, or 0 to hold
+        it until the session ends.
+        Outside a session the lock is held for one chunk at a time, so
+        set_flow_control() sets how long it is held."""
+        self._max_hold = max_hold
+
+    @property
+    def ready(self):
+        """True when the display has had time to process the last command."""
+        return monotonic_ns() >= self._busy_until
+
+    @property
+    def wait_time(self):
+        """Seconds until the display has had time to process the last
+        command, 0 when it is ready."""
+        return max(0, self._busy_until - monotonic_ns()) / 1000000000
+
+    def wait(self):
+        """Wait until the display has had time to process the last command.
+        The driver waits only when a new command would reach the display
+        too early, so other work can be done in the meantime."""
+        self._wait_ready()
+
+    def set_flow_control(self, chunk_size=None, byte_rate=None):
+        """Set how data is paced to the display.
+        chunk_size - largest number of bytes sent in one transfer, longer
+        writes are split into chunks of this size.
+        byte_rate - characters a second the display is sent at most, each
+        transfer keeps the display busy for its length at this rate.
+        Either one can be 0 to turn it off, or None to leave it as is.
+        The defaults suit the OpenLCD firmware over each transport."""
+        if chunk_size is not None:
+            self._chunk_size = chunk_size
+        if byte_rate is not None:
+            self._byte_rate = byte_rate
+
+    def instrument(self, enable=True, on_transfer=None):
+        """Turn on or off the recording of counters for each public method.
+        on_transfer - optional function called after each transfer to the
+        display as on_transfer(method, data, seconds)
+
+        The stats property holds, for each method called, the number of
+        calls, the bytes it sent or added to a batch, the seconds spent waiting
+        for the display and the total seconds spent in the method."""
+        cls = type(self)
+        for name in dir(cls):
+            if name.startswith("_") or name in ("instrument", "reset_stats"):
+                continue
+            if not callable(getattr(cls, name)):
+                continue
+            # drop any earlier wrapper
+            if name in self.__dict__:
+                delattr(self, name)
+            if enable:
+                setattr(self, name, self._instrumented(name, getattr(self, name)))
+        self._on_transfer = on_transfer if enable else None
+        self._stats = {} if enable else None
+
+    @property
+    def stats(self):
+        """Dictionary of counters for each method name, or None when not
+        instrumented.  Each entry is a dictionary with the "calls",
+        "bytes", "blocked" and "time" for the method."""
+        return self._stats
+
+    def reset_stats(self):
+        """Clear the counters recorded since instrument() was called."""
+        if self._stats is not None:
+            self._stats.clear()
+
+    # abstract methods
+
+    def _write_bytes(self, data):
+        pass
+
+    def _bus_device(self):
+        """Bus device whose context holds the bus lock, or None"""
+        return None
+
+    # private functions
+
+    def _held_device(self, size):
+        """The bus device held by session() or None outside a session.
+        Lets the bus lock go and takes it again when writing size bytes
+        more would hold it for longer than max_hold bytes."""
+        session = self._session
+        if session.device is None:
+            return None
+        held = session.held_bytes
+        if self._max_hold and held and held + size > self._max_hold:
+            session.release()
+            session.acquire()
+        session.held_bytes += size
+        return session.device
+
+    def _send(self, data):
+        """Write bytes to the display, or add them to the pending batch."""
+        self._count_bytes(len(data))
+        if self._batch_depth:
+            self._pending.extend(data)
+        else:
+            self._wait_ready()
+            self._transfer(data)
+
+    def _wait_ready(self):
+        """Sleep until the display can take the next command."""
+        remaining = self._busy_until - monotonic_ns()
+        if remaining > 0:
+            self._pause(remaining / 1000000000)
+            if self._stats is not None:
+                self._method_stats()["blocked"] += remaining / 1000000000
+
+    def _pause(self, seconds):
+        """Sleep, letting go of a bus held by session() in the meantime so
+        the other devices on it are not kept waiting for the display."""
+        session = self._session
+        if session.device is None:
+            sleep(seconds)
+            return
+        session.release()
+        try:
+            sleep(seconds)
+        finally:
+            session.acquire()
+
+    def _transfer(self, data):
+        """Write bytes to the display now, in chunks that fit its receive
+        buffer and no faster than it can process them."""
+        size = len(data)
+        chunk_size = self._chunk_size or size
+        if size <= chunk_size:
+            self._write_paced(data)
+            return
+        # The views are released even when a write fails, so an error kept
+        # by the caller does not stop the buffer from being reused
+        view = memoryview(data)
+        try:
+            for start in range(0, size, chunk_size):
+                self._wait_ready()
+                chunk = view[start : start + chunk_size]
+                try:
+                    self._write_paced(chunk)
+                finally:
+                    _release(chunk)
+        finally:
+            _release(view)
+
+    def _write_paced(self, data):
+        """Write one chunk and keep the display busy for as long as it
+        takes to process it."""
+        self._write_chunk(data)
+        if self._byte_rate:
+            self._busy_until = max(self._busy_until, monotonic_ns()) + (
+                len(data) * 1000000000 // self._byte_rate
+            )
+
+    def _write_chunk(self, data):
+        """Write bytes to the display and pass them to on_transfer if
+        instrumented."""
+        if self._on_transfer is None:
+            self._write_bytes(data)
+            return
+        start = monotonic_ns()
+        self._write_bytes(data)
+        seconds = (monotonic_ns() - start) / 1000000000
+        # a copy, as data may be a view of a buffer that is reused
+        self._on_transfer(self._stats_method or "batch", bytes(data), seconds)
+
+    def _count_bytes(self, size):
+        """Charge bytes to the method that sends or queues them, as a
+        batch is written out later by whichever call ends it."""
+        if self._stats is not None:
+            self._method_stats()["bytes"] += size
+
+    def _method_stats(self, name=None):
+        """Counters for a method, by default the one being run."""
+        name = name or self._stats_method or "batch"
+        counters = self._stats.get(name)
+        if counters is None:
+            counters = {"calls": 0, "bytes": 0, "blocked": 0.0, "time": 0.0}
+            self._stats[name] = counters
+        return counters
+
+    def _instrumented(self, name, method):
+        """Wrap a public method to record its counters."""
+
+        def wrapper(*args, **kwargs):
+            # Only count the outermost call, as methods call each other
+            if self._stats_method is not None:
+                return method(*args, **kwargs)
+            self._stats_method = name
+            start = monotonic_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._stats_method = None
+                if self._stats is not None:
+                    counters = self._method_stats(name)
+                    counters["calls"] += 1
+                    counters["time"] += (monotonic_ns() - start) / 1000000000
+
+        return wrapper
+
+    def _settle(self, delay):
+        """Give the display time to process the last command.  Nothing
+        more is sent to the display until delay seconds have passed."""
+        if self._batch_depth:
+            self._pending_settle = max(self._pending_settle, delay)
+        else:
+            self._busy_until = max(self._busy_until, monotonic_ns()) + int(
+                delay * 1000000000
+            )
+
+    def _flush(self):
+        """Send the pending batch to the display."""
+        if self._pending:
+            self._wait_ready()
+            try:
+                self._transfer(self._pending)
+            finally:
+                # Drop the batch even if the write failed, so it is never
+                # sent again after later commands
+                del self._pending[:]
+        if self._pending_settle:
+            settle = self._pending_settle
+            self._pending_settle = 0
+            self._settle(settle)
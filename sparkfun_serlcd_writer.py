@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021 Gaston Williams
+#
+# SPDX-License-Identifier: MIT
+"""
+`sparkfun_serlcd_writer`
+================================================================================
+
+Background writer for the Sparkfun Serial LCD displays
+
+
+* Author(s): Gaston Williams
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* threading, only on CPython and Blinka
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_SerLCD.git"
+
+# private constants
+# Calls that replace any earlier queued call with the same key
+_WRITER_KEYS = {
+    "set_backlight": "backlight",
+    "set_backlight_rgb": "backlight",
+    "set_fast_backlight": "backlight",
+    "set_fast_backlight_rgb": "backlight",
+    "set_contrast": "contrast",
+    "display": "display",
+    "cursor": "cursor",
+    "blink": "blink",
+    "write_frame": "frame",
+}
+
+
+class Sparkfun_SerLCD_Writer:
+    """Send commands to a Sparkfun Serial LCD display from a background
+    thread, so the caller never waits for the display.  Needs threading,
+    so it is for CPython and Blinka only.
+    lcd - Sparkfun_SerLCD driver object
+    maxsize - most calls kept in the queue
+
+    Every public method of Sparkfun_SerLCD can be called on the writer.
+    The call is queued and returns at once, and the thread sends queued
+    calls in batches.  A new backlight color, contrast, frame, display,
+    cursor or blink call, or text written with write_at() to the same
+    position, replaces the queued one so only the latest is sent.  When
+    the queue is full, the oldest call is dropped and counted in dropped.
+
+    writer = Sparkfun_SerLCD_Writer(serlcd)
+    writer.write_at(0, 1, "Temp: 21.5")
+    writer.set_fast_backlight(0x00FF00)"""
+
+    def __init__(self, lcd, maxsize=32):
+        try:
+            # pylint: disable=import-outside-toplevel
+            import threading
+        except ImportError as error:
+            raise RuntimeError("Sparkfun_SerLCD_Writer requires threading") from error
+        self._lcd = lcd
+        self._maxsize = maxsize
+        self._queue = []
+        self._busy = False
+        self._running = True
+        self._condition = threading.Condition()
+        self.dropped = 0
+        self.error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if not callable(getattr(self._lcd, name)):
+            return getattr(self._lcd, name)
+
+        def method(*args, **kwargs):
+            key = _WRITER_KEYS.get(name)
+            if name == "write_bytes":
+                # the caller may reuse its buffer
+                args = (bytes(args[0]),)
+            elif name == "write_row":
+                key = ("row", args[0])
+            self._put(key, name, args, kwargs)
+
+        return method
+
+    def write_at(self, col, row, message):
+        """Queue text to write at a position, replacing any text queued
+        for the same position."""
+        self._put(("text", col, row), "write_at", (col, row, message), {})
+
+    def flush(self):
+        """Wait until every queued call has been sent."""
+        with self._condition:
+            while self._queue or self._busy:
+                self._condition.wait()
+
+    def close(self):
+        """Send the queued calls and stop the thread."""
+        self.flush()
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _put(self, key, name, args, kwargs):
+        """Add a call to the queue, replacing a queued call with the same key."""
+        with self._condition:
+            queue = self._queue
+            if key is not None:
+                for i, entry in enumerate(queue):
+                    if entry[0] == key:
+                        # the latest call goes at the end, after the others
+                        del queue[i]
+                        break
+            if len(queue) >= self._maxsize:
+                del queue[0]
+                self.dropped += 1
+            queue.append((key, name, args, kwargs))
+            self._condition.notify_all()
+
+    def _run(self):
+        """Send queued calls until closed."""
+        lcd = self._lcd
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                calls = self._queue
+                self._queue = []
+                self._busy = True
+            try:
+                with lcd.batch():
+                    for _, name, args, kwargs in calls:
+                        if name == "write_at":
+                            lcd.set_cursor(args[0], args[1])
+                            lcd.write(args[2])
+                        else:
+                            getattr(lcd, name)(*args, **kwargs)
+                lcd.wait()
+            except Exception as error:  # pylint: disable=broad-except
+                # keep the thread running and let the caller check
+                self.error = error
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()